@@ -133,9 +133,9 @@ def _expand_mesh_times(b, dataset_ps, component):
                 # then we need to concatenate over all components_
                 # (times@rv@primary and times@rv@secondary are not necessarily
                 # identical)
-                add_times = np.unique(np.append(*[add_ps.get_value(qualifier='compute_times', component=c) for c in add_ps_components]))
+                add_times = np.unique(np.concatenate([add_ps.get_value(qualifier='compute_times', component=c) for c in add_ps_components]))
                 if not len(add_times):
-                    add_times = np.unique(np.append(*[add_ps.get_value(qualifier=add_timequalifier, component=c) for c in add_ps_components]))
+                    add_times = np.unique(np.concatenate([add_ps.get_value(qualifier=add_timequalifier, component=c) for c in add_ps_components]))
             else:
                 # then we're adding from some dataset at the system-level (like lcs)
                 # that have component=None
@@ -154,9 +154,9 @@ def _expand_mesh_times(b, dataset_ps, component):
 
     # we're first going to access the compute_times@mesh... this should not have a component tag
     this_times = dataset_ps.get_value(qualifier='compute_times', component=None, unit=u.d)
-    this_times = np.unique(np.append(this_times,
-                                     [get_times(b, include_times_entry) for include_times_entry in dataset_ps.get_value(qualifier='include_times', expand=True)]
-                                     )
+    this_times = np.unique(np.concatenate([this_times] +
+                                          [get_times(b, include_times_entry) for include_times_entry in dataset_ps.get_value(qualifier='include_times', expand=True)]
+                                          )
                            )
 
     return this_times
@@ -788,7 +788,8 @@ class SampleOverModel(object):
 
         if is_master:
             compute_ps = b.get_compute(compute=compute, **_skip_filter_checks)
-            compute_kwargs = {k:v for k,v in kwargs.items() if k in compute_ps.qualifiers+['progressbar', 'skip_checks', 'times'] and 'sample' not in k}
+            compute_qualifiers = compute_ps.qualifiers+['progressbar', 'skip_checks', 'times']
+            compute_kwargs = {k:v for k,v in kwargs.items() if k in compute_qualifiers and 'sample' not in k}
 
             # sample_from = compute_ps.get_value(qualifier='sample_from', sample_from=kwargs.get('sample_from', None), expand=True, **_skip_filter_checks)
             # sample_from_combine = compute_ps.get_value(qualifier='sample_from_combine', sample_from_combine=kwargs.get('sample_from_combine', None), **_skip_filter_checks)
@@ -1465,7 +1466,7 @@ class PhoebeBackend(BaseBackendByTime):
                                                   body.mesh.visibilities,
                                                   time, info))
                 if 'visible_centroids' in info['mesh_columns']:
-                    vcs = np.sum(body.mesh.vertices_per_triangle*body.mesh.weights[:,:,np.newaxis], axis=1)
+                    vcs = np.einsum('ijk,ij->ik', body.mesh.vertices_per_triangle, body.mesh.weights)
                     for i,vc in enumerate(vcs):
                         if np.all(vc==np.array([0,0,0])):
                             vcs[i] = np.full(3, np.nan)
@@ -11,9 +11,16 @@ _EXPORT_HORIZON = False
 
 logger = logging.getLogger("ECLIPSE")
 
-def _graham_scan_inside_hull(front, back):
-    sa = np.argsort(front[:,0], kind='heapsort')
-    hull, inside = ceclipse.graham_scan_inside_hull(front[sa], back)
+def _graham_scan_inside_hull(front, back, presorted=False):
+    # the scan expects the hull points sorted in x
+    if not presorted:
+        front = front[np.argsort(front[:,0], kind='heapsort')]
+    # ceclipse reads the raw buffers as packed (N, 2) doubles, so strided
+    # views (ie. vertices[:,:2]) need to be copied first.  This is a no-op
+    # for the fancy-indexed arrays passed by graham.
+    front = np.ascontiguousarray(front, dtype=float)
+    back = np.ascontiguousarray(back, dtype=float)
+    hull, inside = ceclipse.graham_scan_inside_hull(front, back)
     return hull, inside
 
 """
@@ -134,9 +141,10 @@ def only_horizon(meshes, xs, ys, zs, expose_horizon=False):
     # if visibility == 0.5, it should stay 0.5 if mu > 0 else it should become 0
     # if visibility == 1, it should stay 1 if mu > 0 else it should become 0
 
-    # this can all by easily done by multiplying by int(mu>0) (1 if visible, 0 if hidden)
+    # this can all by easily done by masking with mu>0 (keep if visible, 0 if
+    # hidden) directly, without casting the mask to an int array first
 
-    return {comp_no: mesh.visibilities * (mesh.mus > 0).astype(int) for comp_no, mesh in meshes.items() if mesh is not None}, None, None
+    return {comp_no: np.where(mesh.mus > 0, mesh.visibilities, 0.0) for comp_no, mesh in meshes.items() if mesh is not None}, None, None
 
 def native(meshes, xs, ys, zs, expose_horizon=False, horizon_method='boolean'):
     """
@@ -235,6 +243,24 @@ def graham(meshes, xs, ys, zs, expose_horizon=False):
         mesh_front = meshes[comp_front]
         visibility_front = visibilities[comp_front]
 
+        # The hull only depends on the front body, so gather its projected
+        # visible vertices once instead of for every body behind it.  Each
+        # vertex is shared by several triangles, but the hull only needs each
+        # point once, which also cuts down the points to sort and scan.
+        # The points are sorted in x by ordering the vertex indices on the
+        # x-column, so they only need to be gathered (copied) once.
+        front_inds = np.unique(mesh_front.triangles[visibility_front > 0.0])
+        front_inds = front_inds[np.argsort(mesh_front.vertices[front_inds, 0], kind='heapsort')]
+        front = mesh_front.vertices[front_inds, :2]
+
+        # Star in front ---> star in back
+        if not front.shape[0]:
+            continue
+
+        # projected bounding box of the front body (front is sorted in x)
+        front_xmin, front_xmax = front[0,0], front[-1,0]
+        front_ymin, front_ymax = front[:,1].min(), front[:,1].max()
+
         for i_back in range(i_front+1, nbodies):
             # for a binary, i_back will only be 1
             comp_no_back = front_to_back_comp_nos[i_back]
@@ -249,24 +275,33 @@ def graham(meshes, xs, ys, zs, expose_horizon=False):
             if np.all(visibility_back==0.0):
                 continue
 
+            # If the projected bounding boxes don't overlap, nothing of
+            # mesh_back can be behind mesh_front and we can skip building the
+            # hull entirely (this is the case for most out-of-eclipse phases).
+            back_min = mesh_back.vertices[:,:2].min(axis=0)
+            back_max = mesh_back.vertices[:,:2].max(axis=0)
+            if front_xmax < back_min[0] or back_max[0] < front_xmin or \
+                    front_ymax < back_min[1] or back_max[1] < front_ymin:
+                continue
+
             # Determine a scale factor for the triangle
             min_size_back = mesh_back.areas.min()
             distance = distance_factor * 2.0/3**0.25*np.sqrt(min_size_back)
 
-            # Select only those triangles that are not hidden
-            tri_back_vis = mesh_back.vertices_per_triangle[visibility_back > 0.0].reshape(-1,9)
-            tri_front_vis = mesh_front.vertices_per_triangle[visibility_front > 0.0].reshape(-1,9)
-
-            back = np.vstack([tri_back_vis[:,0:2], tri_back_vis[:,3:5], tri_back_vis[:,6:8]])
-            front = np.vstack([tri_front_vis[:,0:2], tri_front_vis[:,3:5], tri_front_vis[:,6:8]])
-
-            # Star in front ---> star in back
-            if not front.shape[0]:
-                continue
-
-            hull, inside = _graham_scan_inside_hull(front, back)
-            hidden = inside.reshape(3,-1).all(axis=0)
-            visible = ~(inside.reshape(3,-1).any(axis=0))
+            # Select only those triangles that are not hidden.  Vertices are
+            # shared between triangles, so test each projected vertex once in
+            # a single call and map the results back onto the (3xN) vertices
+            # of the visible triangles (all first, second and third vertices
+            # in contiguous blocks).
+            back_vis_inds = np.flatnonzero(visibility_back > 0.0)
+            tri_back_vis = mesh_back.triangles[back_vis_inds]
+            vert_back, vert_back_inds = np.unique(tri_back_vis.T.ravel(), return_inverse=True)
+            back = mesh_back.vertices[vert_back, :2]
+
+            hull, inside = _graham_scan_inside_hull(front, back, presorted=True)
+            inside = inside[vert_back_inds].reshape(3,-1)
+            hidden = inside.all(axis=0)
+            visible = ~inside.any(axis=0)
 
             # Triangles that are partially hidden are those that are not
             # completely hidden, but do have at least one vertex hidden
@@ -274,8 +309,8 @@ def graham(meshes, xs, ys, zs, expose_horizon=False):
 
             # These returned visibilities are only from mesh_back_vis
             # So to apply back to our master visibilities parameter, we need
-            # to find the correct inds.
-            visibility_back[visibility_back > 0.0] = 1.0*visible + 0.5*partial
+            # to find the correct inds (the same ones we selected above).
+            visibility_back[back_vis_inds] = 1.0*visible + 0.5*partial
 
 
             ###################################################
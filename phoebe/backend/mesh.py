@@ -27,7 +27,7 @@ def compute_volume(sizes, centers, normals):
     # TODO: remove this function - should now be returned by the meshing algorithm itself
     # although wd method may currently use this
     normal_mags = np.linalg.norm(normals, axis=1) #np.sqrt((normals**2).sum(axis=1))
-    return np.sum(sizes*((centers*normals).sum(axis=1)/normal_mags)/3)
+    return np.sum(sizes*(np.einsum('ij,ij->i', centers, normals)/normal_mags)/3)
 
 
 def euler_trans_matrix(etheta, elongan, eincl):
@@ -428,9 +428,12 @@ class ComputedColumn(object):
         vertices_per_triangle = self.vertices_per_triangle
         if vertices_per_triangle.ndim==2:
             # return np.dot(self.vertices_per_triangle, self.mesh.weights)
-            return np.sum(vertices_per_triangle*self.mesh.weights, axis=1)
+            return np.einsum('ij,ij->i', vertices_per_triangle, self.mesh.weights)
         elif vertices_per_triangle.ndim==3:
-            return np.sum(vertices_per_triangle*self.mesh.weights[:,np.newaxis], axis=1)
+            # vector quantities (Nx3x3: triangle, vertex, x/y/z): sum over the
+            # 3 vertices of each triangle weighted by that vertex's weight,
+            # separately for each of the (x,y,z) components
+            return np.einsum('ijk,ij->ik', vertices_per_triangle, self.mesh.weights)
         else:
             raise NotImplementedError
 
@@ -1620,14 +1623,20 @@ class Meshes(object):
             return np.array([])
 
         if offset:
-            values = []
+            # stack once and then shift each component's block in place,
+            # rather than making an offset copy of every component first
+            packed = np.concatenate([value[c] for c in components])
+            N_lower = 0
             offsetN = 0
             for c in components:
-                values.append(value[c]+offsetN)
+                N_upper = N_lower + len(value[c])
+                packed[N_lower:N_upper] += offsetN
                 offsetN += len(self[c]['vertices'])
+                N_lower = N_upper
 
-        else:
-            values = [value[c] for c in components]
+            return packed
+
+        values = [value[c] for c in components]
 
         if len(value[components[0]].shape) > 1:
             return np.vstack(values)
@@ -111,6 +111,9 @@ class System(object):
         self.horizon_method = horizon_method
         self.dynamics_method = dynamics_method
         self.irrad_method = irrad_method
+        # libphoebe expects the title-cased method name as bytes, resolve it
+        # once here rather than on every call to handle_reflection
+        self._irrad_method_bytes = _bytes(irrad_method.title())
 
         self.is_first_refl_iteration = True
 
@@ -241,7 +244,7 @@ class System(object):
 
     @property
     def needs_recompute_instantaneous(self):
-        return np.any([b.needs_recompute_instantaneous for b in self.bodies])
+        return any(b.needs_recompute_instantaneous for b in self.bodies)
 
     @property
     def mesh_bodies(self):
@@ -349,11 +352,13 @@ class System(object):
 
         fluxes_intrins_flat = meshes.pack_column_flat(fluxes_intrins_per_body)
 
-        if len(fluxes_intrins_per_body) == 1 and np.all([body.is_convex for body in self.bodies]):
+        all_convex = all(body.is_convex for body in self.bodies)
+
+        if len(fluxes_intrins_per_body) == 1 and all_convex:
             logger.info("skipping reflection because only 1 (convex) body")
             return
 
-        elif np.all([body.is_convex for body in self.bodies]):
+        elif all_convex:
             logger.debug("handling reflection (convex case), method='{}'".format(self.irrad_method))
 
             vertices_per_body = list(meshes.get_column('vertices').values())
@@ -372,7 +377,7 @@ class System(object):
                                                                                        irrad_frac_refl_per_body,
                                                                                        fluxes_intrins_per_body,
                                                                                        ld_func_and_coeffs,
-                                                                                       _bytes(self.irrad_method.title()),
+                                                                                       self._irrad_method_bytes,
                                                                                        support=_bytes('vertices')
                                                                                        )
 
@@ -398,7 +403,7 @@ class System(object):
                                                                             fluxes_intrins_flat,
                                                                             ld_func_and_coeffs,
                                                                             ld_inds_flat,
-                                                                            _bytes(self.irrad_method.title()),
+                                                                            self._irrad_method_bytes,
                                                                             support=_bytes('vertices')
                                                                             )
 
@@ -455,17 +460,17 @@ class System(object):
                 possible_eclipse = False
         else:
             logger.debug("system.handle_eclipses: determining if eclipses are possible from instantaneous_maxr")
-            max_rs = [body.instantaneous_maxr for body in self.bodies]
+            max_rs = np.array([body.instantaneous_maxr for body in self.bodies])
             # logger.debug("system.handle_eclipses: max_rs={}".format(max_rs))
-            for i in range(0, len(max_rs)-1):
-                for j in range(i+1, len(max_rs)):
-                    proj_sep_sq = sum([(c[i]-c[j])**2 for c in (self.xs,self.ys)])
-                    max_sep_ecl = max_rs[i] + max_rs[j]
 
-                    if proj_sep_sq < (1.05*max_sep_ecl)**2:
-                        # then this pair has the potential for eclipsing triangles
-                        possible_eclipse = True
-                        break
+            # test all pairs at once (upper triangle of the NxN separation
+            # matrix) rather than looping over each pair in python
+            i, j = np.triu_indices(len(max_rs), k=1)
+            proj_sep_sq = (self.xs[i]-self.xs[j])**2 + (self.ys[i]-self.ys[j])**2
+            max_sep_ecl = max_rs[i] + max_rs[j]
+
+            # any pair with the potential for eclipsing triangles
+            possible_eclipse = bool(np.any(proj_sep_sq < (1.05*max_sep_ecl)**2))
 
         if not possible_eclipse and not expose_horizon and horizon_method=='boolean':
             eclipse_method = 'only_horizon'
@@ -475,8 +480,10 @@ class System(object):
         # back to the current mesh for each body.
         meshes = self.meshes
 
-        # Reset all visibilities to be fully visible to start
-        meshes.update_columns('visiblities', 1.0)
+        # Reset all visibilities to be fully visible to start.  Clearing the
+        # column lets each mesh fall back on its all-visible default instead
+        # of attaching (and allocating) a new observable column every time.
+        meshes.update_columns('visibilities', None)
 
         ecl_func = getattr(eclipse, eclipse_method)
 
@@ -45,6 +45,11 @@ def phases_to_times(phase, period_choice, period, period_anom, dpdt_choice, dpdt
     if dpdt != 0:
         # NOTE: this seems to be incorrect and giving ridiculous answers
         time = t0 + 1./dpdt*(np.exp(dpdt*(phase))-period)
+    elif isinstance(phase, np.ndarray) and phase.dtype.kind == 'f':
+        # operate in-place on a single new array rather than allocating a
+        # temporary array for each operation
+        time = phase * period
+        time += t0
     else:
         time = t0 + (phase)*period
 
@@ -81,6 +86,12 @@ def times_to_phases(time, period_choice, period, period_anom, dpdt_choice, dpdt,
 
     if dpdt != 0:
         phase = np.mod(1./dpdt * np.log(period + dpdt*(time-t0)), 1.0)
+    elif isinstance(time, np.ndarray) and time.dtype.kind == 'f':
+        # operate in-place on a single new array rather than allocating a
+        # temporary array for each operation
+        phase = time - t0
+        phase /= period
+        np.mod(phase, 1.0, out=phase)
     else:
         phase = np.mod((time-t0)/period, 1.0)
 
@@ -100,11 +100,14 @@ class ConstraintVar(object):
         """
         if self.is_param:
             # TODO: CAREFUL, this may cause infinite loops if we try to run constraints through get_value
-            try:
-                return self._bundle.get_quantity(uniqueid=self.unique_label, units=units, t=t, check_visible=False, check_default=False)
-            except AttributeError:
+            # go through the cached parameter object rather than filtering
+            # the bundle on every evaluation of the constraint
+            param = self.get_parameter()
+            if hasattr(param, 'get_quantity'):
+                return param.get_quantity(t=t)
+            else:
                 # then not a FloatParameter
-                return self._bundle.get_value(uniqueid=self.unique_label, check_visible=False, check_default=False)
+                return param.get_value()
 
         else:
             # TODO: constants and methods
@@ -118,7 +121,7 @@ class ConstraintVar(object):
         """
         if self.is_param:
             # TODO: CAREFUL, this may cause infinite loops if we try to run constraints through get_value
-            return self._bundle.get_value(uniqueid=self.unique_label, units=units, t=t, check_visible=False, check_default=False)
+            return self.get_parameter().get_value(t=t)
 
         else:
             # TODO: constants and methods
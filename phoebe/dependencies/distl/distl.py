@@ -4268,8 +4268,11 @@ class DistributionCollection(BaseDistlObject):
         if seeds is None:
             seeds = {}
 
+        # get_random_seed copies the entire state of the random number
+        # generator, which doesn't change within this loop, so only do it once
+        random_seed = get_random_seed()
         for i,dist in enumerate(self.dists_unpacked):
-            seeds.setdefault(dist.uniqueid, get_random_seed()[i])
+            seeds.setdefault(dist.uniqueid, random_seed[i])
 
         sample_kwargs = {k:v for k,v in kwargs.items() if k not in ['seeds']}
         # print("*** seeds: {}, sample_kwargs: {}".format(seeds, sample_kwargs))
@@ -1,6 +1,8 @@
 from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 
+import functools
+
 from astropy import __version__ as astropyversion
 
 # import these so they'll be available as unitsiau2015.u and unitsiau2015.c
@@ -111,12 +113,19 @@ def to_solar(object):
     --------
     * NotImplementedError: if cannot convert to solar
     """
-    physical_type = _get_physical_type(object)
+    unit = object if hasattr(object, 'physical_type') else object.unit
+    return object.to(_solar_unit(unit))
+
+@functools.lru_cache(maxsize=None)
+def _solar_unit(unit):
+    # determining the physical type and parsing the target unit cost more
+    # than the conversion itself, so only do this once per unit
+    physical_type = _get_physical_type(unit)
 
     if physical_type not in _physical_types_to_solar.keys():
         raise NotImplementedError("cannot convert object with physical_type={} to solar units".format(physical_type))
 
-    return object.to(_physical_types_to_solar.get(physical_type))
+    return u.Unit(_physical_types_to_solar.get(physical_type))
 
 u.can_convert_to_solar = can_convert_to_solar
 u.to_solar = to_solar
@@ -35,7 +35,7 @@ from phoebe.parameters import constraint as _constraint
 from phoebe.parameters import feature as _feature
 from phoebe.parameters import figure as _figure
 from phoebe.parameters import server as _server
-from phoebe.parameters.parameters import _uniqueid, _clientid, _return_ps, _extract_index_from_string, _corner_twig, _corner_label, _cached_crimpl_servers
+from phoebe.parameters.parameters import _uniqueid, _clientid, _return_ps, _extract_index_from_string, _corner_twig, _corner_label, _cached_crimpl_servers, _tags_changed
 from phoebe.backend import backends, mesh
 from phoebe.backend import universe as _universe
 from phoebe.solverbackends import solverbackends as _solverbackends
@@ -1031,7 +1031,7 @@ class Bundle(ParameterSet):
         """
         # TODO: support default cases from server?
 
-        if server[:4] != "http":
+        if not server.startswith("http"):
             server = "http://"+server
         url = "{}/json_bundle/{}".format(server, bundleid)
         logger.info("downloading bundle from {}".format(url))
@@ -1451,8 +1451,9 @@ class Bundle(ParameterSet):
             filename = os.path.expanduser(filename)
 
         computeparams = self.get_compute(compute=compute, kind='ellc')
+        compute_qualifiers = computeparams.qualifiers
 
-        system, pblums_abs, pblums_scale, pblums_rel, pbfluxes = self.compute_pblums(compute=compute, ret_structured_dicts=True, skip_checks=True, **{k:v for k,v in kwargs.items() if k in computeparams.qualifiers})
+        system, pblums_abs, pblums_scale, pblums_rel, pbfluxes = self.compute_pblums(compute=compute, ret_structured_dicts=True, skip_checks=True, **{k:v for k,v in kwargs.items() if k in compute_qualifiers})
         # l3s = self.compute_l3s(compute=compute, use_pbfluxes=pbfluxes, ret_structured_dicts=True, skip_checks=True, skip_compute_ld_coeffs=True, **{k:v for k,v in kwargs.items() if k in computeparams.qualifiers})
 
         dataset_this_compute = computeparams.filter(qualifier='enabled', value=True, **_skip_filter_checks).datasets
@@ -1896,6 +1897,7 @@ class Bundle(ParameterSet):
         for param in self.filter(check_visible=False, check_default=False, **{tag: old_value}).to_list():
             setattr(param, '_{}'.format(tag), new_value)
             affected_params.append(param)
+        _tags_changed()
         for param in self.filter(context='constraint', check_visible=False, check_default=False).to_list():
             for k, v in param.constraint_kwargs.items():
                 if v == old_value:
@@ -3875,7 +3877,7 @@ class Bundle(ParameterSet):
             else:
                 return False, "ld_coeffs={} wrong length (expecting length {} instead of {}) for ld_func='{}'.".format(ld_coeffs, expected_lengths.get(ld_func), len(ld_coeffs), ld_func)
 
-        irrad_enabled = kwargs.get('irrad_method', True) != 'none' and np.any([p.get_value()!='none' for p in self.filter(qualifier='irrad_method', compute=computes, **kwargs).to_list()])
+        irrad_enabled = kwargs.get('irrad_method', True) != 'none' and any(p.get_value()!='none' for p in self.filter(qualifier='irrad_method', compute=computes, **kwargs).to_list())
         for component in hier_stars:
             if irrad_enabled:
                 # first check ld_coeffs_bol vs ld_func_bol
@@ -4256,10 +4258,10 @@ class Bundle(ParameterSet):
                                 True, 'run_compute')
 
             # misalignment checks
-            if compute_kind != 'phoebe' and np.any([p.get_value() != 0 for p in self.filter(qualifier=['pitch', 'yaw'], context='component', **_skip_filter_checks).to_list()]):
+            if compute_kind != 'phoebe' and any(p.get_value() != 0 for p in self.filter(qualifier=['pitch', 'yaw'], context='component', **_skip_filter_checks).to_list()):
                 # then we have a misaligned system in an alternate backend
                 if compute_kind == 'ellc':
-                    if np.all([p.get_value(distortion_method=kwargs.get('distortion_method')) == 'sphere' for p in self.filter(qualifier='distortion_method', compute=compute, context='compute', **_skip_filter_checks).to_list()]):
+                    if all(p.get_value(distortion_method=kwargs.get('distortion_method')) == 'sphere' for p in self.filter(qualifier='distortion_method', compute=compute, context='compute', **_skip_filter_checks).to_list()):
                         # then misalignment is supported, but we'll raise a warning that it only handles RM in RVs
                         report.add_item(self,
                                         "ellc (compute='{}') only considers misalginment for the Rossiter-McLaughlin contribution to RVs".format(compute),
@@ -7427,7 +7429,7 @@ class Bundle(ParameterSet):
 
 
         newly_constrained_param = constraint_param.get_constrained_parameter()
-        check_kwargs = {k:v for k,v in newly_constrained_param.meta.items() if k not in ['context', 'twig', 'uniquetwig']}
+        check_kwargs = dict(newly_constrained_param.get_meta(ignore=['uniqueid', 'context', 'twig', 'uniquetwig']))
         check_kwargs['context'] = 'constraint'
         check_kwargs['check_visible'] = False
         if len(self._bundle.filter(**check_kwargs)):
@@ -7597,7 +7599,7 @@ class Bundle(ParameterSet):
             else:
                 return np.isnan(value)
 
-        if kwargs.pop('check_nan', True) and np.any([_check_nan(p.get_value()) for p in param.vars.to_list() if hasattr(p, 'get_quantity')]):
+        if kwargs.pop('check_nan', True) and any(_check_nan(p.get_value()) for p in param.vars.to_list() if hasattr(p, 'get_quantity')):
             raise ValueError("cannot flip constraint while the value of {} is nan".format([p.twig for p in param.vars.to_list() if np.isnan(p.get_value())]))
 
         if solve_for is None:
@@ -7718,24 +7720,10 @@ class Bundle(ParameterSet):
         logger.debug("bundle.run_constraint {}".format(expression_param.twig))
 
 
-        kwargs = {}
-        kwargs['twig'] = None
-        # TODO: this might not be the case, we just know its not in constraint
-        kwargs['qualifier'] = expression_param.qualifier
-        kwargs['component'] = expression_param.component
-        kwargs['dataset'] = expression_param.dataset
-        kwargs['feature'] = expression_param.feature
-        kwargs['context'] = ['system']
-        if kwargs['component'] is not None:
-            kwargs['context'] += ['component']
-        if kwargs['dataset'] is not None:
-            kwargs['context'] += ['dataset']
-        if kwargs['feature'] is not None:
-            kwargs['context'] += ['feature']
-
-        kwargs['check_visible'] = False
-        kwargs['check_default'] = False
-        constrained_param = self.get_parameter(**kwargs)
+        # the constrained parameter is one of the (cached) vars of the
+        # constraint, so there is no need to filter the entire bundle for it
+        # every time the constraint is run
+        constrained_param = expression_param.constrained_parameter
 
         try:
             result = expression_param.get_result(suppress_error=False)
@@ -7760,7 +7748,10 @@ class Bundle(ParameterSet):
         # we won't bother checking for arrays (we'd have to do np.all),
         # but for floats, let's only set the value if the value has changed.
         if not isinstance(result, float) or result != constrained_param.get_value():
-            logger.debug("setting '{}'={} from '{}' constraint".format(constrained_param.uniquetwig, result, expression_param.uniquetwig))
+            # NOTE: uniquetwig filters the entire bundle (several times), so
+            # only build the message if it will actually be logged
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("setting '{}'={} from '{}' constraint".format(constrained_param.uniquetwig, result, expression_param.uniquetwig))
             try:
                 constrained_param.set_value(result, from_constraint=True, force=True)
             except Exception as e:
@@ -7811,12 +7802,47 @@ class Bundle(ParameterSet):
 
         """
         changes = []
+        changed_uniqueids = set()
         delayed_constraints = self._delayed_constraints
         self._delayed_constraints = []
-        for constraint_id in delayed_constraints:
-            param = self.run_constraint(uniqueid=constraint_id, return_parameter=True, skip_kwargs_checks=True)
-            if param not in changes:
-                changes.append(param)
+
+        # running a constraint changes its constrained parameter, which
+        # delays every constraint that depends on that parameter.  Rather
+        # than re-running those constraints once for every upstream change,
+        # find everything downstream of the delayed constraints and run each
+        # once, after all the constraints it depends on.
+        for group in self._order_delayed_constraints(delayed_constraints):
+            # mutually dependent constraints usually settle within a few dozen
+            # iterations (q and mass when solving for q take ~30), but may
+            # never converge at all
+            max_iterations = len(group) + 100
+            iteration = 0
+            while True:
+                for constraint_id in group:
+                    param = self.run_constraint(uniqueid=constraint_id, return_parameter=True, skip_kwargs_checks=True)
+                    if param.uniqueid not in changed_uniqueids:
+                        changes.append(param)
+                        changed_uniqueids.add(param.uniqueid)
+
+                # constraints that depend on each other (e.g. q and mass when
+                # solving for q) are re-run until they stop changing each other
+                # before moving on to anything downstream of them
+                delayed_again = [constraint_id for constraint_id in group if constraint_id in self._delayed_constraints]
+                if len(group) == 1 or not len(delayed_again):
+                    break
+
+                iteration += 1
+                if iteration >= max_iterations:
+                    twigs = [self.get_parameter(uniqueid=constraint_id, **_skip_filter_checks).twig for constraint_id in group]
+                    msg = "delayed constraints {} depend on each other and did not converge after {} iterations".format(twigs, iteration)
+                    logger.error(msg)
+                    raise ValueError(msg)
+
+                self._delayed_constraints = [constraint_id for constraint_id in self._delayed_constraints if constraint_id not in group]
+
+            # anything this group delays downstream will be run by a later group
+            self._delayed_constraints = [constraint_id for constraint_id in self._delayed_constraints if constraint_id not in group]
+
         if len(self._delayed_constraints):
             # some of the calls above may have delayed even more constraints,
             # we must keep calling recursively until they're all cleared
@@ -7824,6 +7850,64 @@ class Bundle(ParameterSet):
 
         return changes
 
+    def _order_delayed_constraints(self, delayed_constraints):
+        """
+        Order the delayed constraints, and all constraints downstream of them,
+        so that each constraint is run after the constraints it depends on.
+
+        Returns
+        ---------
+        * (list): list of lists of constraint uniqueids.  Each inner list is
+            a group of constraints that depend on each other (usually only
+            one constraint).
+        """
+        downstream = {param._is_constraint: param._in_constraints for param in self._params if param._is_constraint is not None}
+
+        constraint_ids = list(delayed_constraints)
+        in_batch = set(constraint_ids)
+        for constraint_id in constraint_ids:
+            for downstream_id in downstream.get(constraint_id, []):
+                if downstream_id not in in_batch:
+                    in_batch.add(downstream_id)
+                    constraint_ids.append(downstream_id)
+
+        reachable = {}
+        for constraint_id in constraint_ids:
+            reachable[constraint_id] = set(downstream.get(constraint_id, []))
+            stack = list(reachable[constraint_id])
+            while len(stack):
+                for downstream_id in downstream.get(stack.pop(), []):
+                    if downstream_id not in reachable[constraint_id]:
+                        reachable[constraint_id].add(downstream_id)
+                        stack.append(downstream_id)
+
+        # constraints that can reach each other are run together as a group
+        groups = []
+        group_index = {}
+        for constraint_id in constraint_ids:
+            if constraint_id in group_index:
+                continue
+            group = [constraint_id] + [other_id for other_id in reachable[constraint_id] if other_id != constraint_id and constraint_id in reachable[other_id]]
+            group = [other_id for other_id in constraint_ids if other_id in group]
+            for other_id in group:
+                group_index[other_id] = len(groups)
+            groups.append(group)
+
+        group_downstream = [set(group_index[downstream_id] for constraint_id in group for downstream_id in downstream.get(constraint_id, [])) - {i} for i, group in enumerate(groups)]
+        n_upstream = [0 for group in groups]
+        for downstream_groups in group_downstream:
+            for i in downstream_groups:
+                n_upstream[i] += 1
+
+        ordered_groups = [i for i in range(len(groups)) if not n_upstream[i]]
+        for i in ordered_groups:
+            for j in sorted(group_downstream[i]):
+                n_upstream[j] -= 1
+                if not n_upstream[j]:
+                    ordered_groups.append(j)
+
+        return [groups[i] for i in ordered_groups]
+
     def run_failed_constraints(self):
         """
         Attempt to rerun all failed constraints that may be preventing
@@ -7910,7 +7994,7 @@ class Bundle(ParameterSet):
 
             metawargs = {'context': 'distribution',
                          'distribution': kwargs['distribution']}
-            for k,v in ref_param.meta.items():
+            for k,v in ref_param.get_meta(ignore=['uniqueid', 'twig', 'uniquetwig']).items():
                 if k in parameters._contexts:
                     metawargs.setdefault(k,v)
 
@@ -9344,9 +9428,9 @@ class Bundle(ParameterSet):
 
         # uniqueids needs to correspond to dc.dists_unpacked, not dc.dists
         if len(dc.dists_unpacked) == len(uniqueids):
-            values = [self.get_value(uniqueid=uid, unit=dist.unit, **_skip_filter_checks) for uid, dist in zip(uniqueids, dc.dists_unpacked)]
+            values = self._get_values_by_uniqueid(uniqueids, [dist.unit for dist in dc.dists_unpacked])
         elif len(dc.dists) == len(uniqueids):
-            values = [self.get_value(uniqueid=uid, unit=dist.unit, **_skip_filter_checks) for uid, dist in zip(uniqueids, dc.dists)]
+            values = self._get_values_by_uniqueid(uniqueids, [dist.unit for dist in dc.dists])
         else:
             ps = self.exclude(context=['distribution', 'constraint'], **_skip_filter_checks)
             values = [ps.get_value(twig=dist.label, unit=dist.unit, **_skip_filter_checks) for dist in dc.dists_unpacked]
@@ -9968,6 +10052,10 @@ class Bundle(ParameterSet):
         kwargs['check_default'] = False
         kwargs['check_visible'] = False
 
+        # qualifiers is rebuilt from all parameters on every access, so only
+        # do that once
+        fig_qualifiers = fig_ps.qualifiers
+
         if fig_ps.kind in self.filter(context='dataset', **_skip_filter_checks).kinds:
             ds_kind = fig_ps.kind
             kwargs['kind'] = ds_kind
@@ -9976,26 +10064,26 @@ class Bundle(ParameterSet):
             comp_same_kind = self.filter(context=['dataset', 'model'], kind=ds_kind, **_skip_filter_checks).components
 
             kwargs.setdefault('kind', ds_kind)
-            if 'contexts' in fig_ps.qualifiers:
+            if 'contexts' in fig_qualifiers:
                 kwargs.setdefault('context', fig_ps.get_value(qualifier='contexts', expand=True, **_skip_filter_checks))
             else:
                 kwargs['context'] = 'model'
 
 
-            if 'datasets' in fig_ps.qualifiers:
+            if 'datasets' in fig_qualifiers:
                 kwargs.setdefault('dataset', fig_ps.get_value(qualifier='datasets', expand=True, **_skip_filter_checks))
-            if 'models' in fig_ps.qualifiers:
+            if 'models' in fig_qualifiers:
                 kwargs.setdefault('model', [None] + fig_ps.get_value(qualifier='models', expand=True, **_skip_filter_checks))
-            if 'components' in fig_ps.qualifiers:
+            if 'components' in fig_qualifiers:
                 kwargs.setdefault('component', fig_ps.get_value(qualifier='components', expand=True, **_skip_filter_checks))
 
             kwargs.setdefault('legend', fig_ps.get_value(qualifier='legend', **_skip_filter_checks))
 
             for q in ['draw_sidebars', 'uncover', 'highlight', 'period', 't0']:
-                if q in fig_ps.qualifiers:
+                if q in fig_qualifiers:
                     kwargs.setdefault(q, fig_ps.get_value(qualifier=q, **_skip_filter_checks))
 
-            if 'time_source' in fig_ps.qualifiers:
+            if 'time_source' in fig_qualifiers:
                 time_source = fig_ps.get_value(qualifier='time_source', **_skip_filter_checks)
                 if time_source == 'default':
                     time_source = self.get_value(qualifier='default_time_source', context='figure', **_skip_filter_checks)
@@ -10118,22 +10206,24 @@ class Bundle(ParameterSet):
                 kwargs['to_uniforms'] = fig_ps.get_value(qualifier='to_uniforms_sigma', to_uniforms_sigma=kwargs.get('to_uniforms_sigma', None), **_skip_filter_checks) if fig_ps.get_value(qualifier='to_uniforms', to_uniforms=kwargs.get('to_uniforms', None), **_skip_filter_checks) else False
                 kwargs['to_univariates'] = True if kwargs['to_uniforms'] else fig_ps.get_value(qualifier='to_univariates', to_univariates=kwargs.get('to_univariates', None), **_skip_filter_checks)
 
-                for k in fig_ps.qualifiers:
-                    if k in ['distributions', 'to_uniforms', 'to_univariates']:
+                # pass along all remaining options (unless overridden) in a
+                # single pass rather than filtering fig_ps for each qualifier
+                for param in fig_ps.to_list():
+                    if param.qualifier in ['distributions', 'to_uniforms', 'to_univariates'] or param.qualifier in kwargs.keys():
                         continue
-                    kwargs.setdefault(k, fig_ps.get_value(qualifier=k, **_skip_filter_checks))
+                    kwargs[param.qualifier] = param.get_value()
             else:
                 # distribution_sets should be something like priors@emcee@solver, sample_from@phoebe01@compute, etc
                 kwargs['twig'] = distribution_set
 
-        elif 'solver' in fig_ps.qualifiers:
+        elif 'solver' in fig_qualifiers:
             kwargs['context'] = 'solver'
             solver = fig_ps.get_value(qualifier='solver', solver=kwargs.get('solver', None), **_skip_filter_checks)
             kwargs['solver'] = solver
             distribution = fig_ps.get_value(qualifier='distribution', distribution=kwargs.get('distribution', None), **_skip_filter_checks)
             kwargs['distribution_twig'] = '{}@{}'.format(distribution, solver)
 
-        elif 'solution' in fig_ps.qualifiers:
+        elif 'solution' in fig_qualifiers:
             kwargs['context'] = 'solution'
 
             kwargs.setdefault('solution', fig_ps.get_value(qualifier='solution', **_skip_filter_checks))
@@ -10141,10 +10231,12 @@ class Bundle(ParameterSet):
                 logger.warning("solution not set, cannot plot")
                 return None, None
 
-            for k in fig_ps.qualifiers:
-                if k in ['solution']:
+            # pass along all remaining options (unless overridden) in a
+            # single pass rather than filtering fig_ps for each qualifier
+            for param in fig_ps.to_list():
+                if param.qualifier in ['solution'] or param.qualifier in kwargs.keys():
                     continue
-                kwargs.setdefault(k, fig_ps.get_value(qualifier=k, **_skip_filter_checks))
+                kwargs[param.qualifier] = param.get_value()
 
         else:
             raise ValueError("nothing found to plot")
@@ -11288,7 +11380,7 @@ class Bundle(ParameterSet):
         changed_params = self.run_delayed_constraints()
 
         if 'solution' in kwargs.keys():
-            if kwargs.get('sample_from', None) is not None or np.any([len(p.get_value()) for p in self.filter(qualifier='sample_from', compute=computes, **_skip_filter_checks).to_list()]) :
+            if kwargs.get('sample_from', None) is not None or any(len(p.get_value()) for p in self.filter(qualifier='sample_from', compute=computes, **_skip_filter_checks).to_list()) :
                 raise ValueError("cannot apply both solution and sample_from")
             else:
                 logger.warning("applying passed solution ({}) to sample_from".format(kwargs.get('solution')))
@@ -11953,13 +12045,17 @@ class Bundle(ParameterSet):
                 # we need to check both for enabled but also passed via dataset kwarg
                 if len(self._datasets_where(compute=compute, mesh_needed=True)) > 0:
                     logger.info("run_compute: computing necessary ld_coeffs, pblums, l3s")
-                    self.compute_ld_coeffs(compute=compute, skip_checks=True, set_value=True, **{k:v for k,v in kwargs.items() if k in computeparams.qualifiers})
+                    # only build the list of qualifiers once rather than for
+                    # each kwarg (for each of the calls below)
+                    compute_qualifiers = computeparams.qualifiers
+                    compute_kwargs = {k:v for k,v in kwargs.items() if k in compute_qualifiers}
+                    self.compute_ld_coeffs(compute=compute, skip_checks=True, set_value=True, **compute_kwargs)
                     # NOTE that if pblum_method != 'phoebe', then system will be None
                     # otherwise the system will be create which we can pass on to the backend
                     # the phoebe backend can then skip initializing the system at least on the master proc
                     # (workers will need to recreate the mesh)
-                    system, pblums_abs, pblums_scale, pblums_rel, pbfluxes = self.compute_pblums(compute=compute, ret_structured_dicts=True, skip_checks=True, **{k:v for k,v in kwargs.items() if k in computeparams.qualifiers})
-                    l3s = self.compute_l3s(compute=compute, use_pbfluxes=pbfluxes, ret_structured_dicts=True, skip_checks=True, skip_compute_ld_coeffs=True, **{k:v for k,v in kwargs.items() if k in computeparams.qualifiers})
+                    system, pblums_abs, pblums_scale, pblums_rel, pbfluxes = self.compute_pblums(compute=compute, ret_structured_dicts=True, skip_checks=True, **compute_kwargs)
+                    l3s = self.compute_l3s(compute=compute, use_pbfluxes=pbfluxes, ret_structured_dicts=True, skip_checks=True, skip_compute_ld_coeffs=True, **compute_kwargs)
                 else:
                     system = None
                     pblums_scale = {}
@@ -12050,12 +12146,12 @@ class Bundle(ParameterSet):
                     datasets_dsscaled += this_dsscale_datasets
                     logger.info("rescaling fluxes to data for dataset={}".format(this_dsscale_datasets))
 
-                    ds_fluxess = np.array([])
-                    ds_sigmass = np.array([])
-                    l3_fluxes = np.array([])
-                    l3_fracs = np.array([])
-                    l3_pblum_abs_sums = np.array([])
-                    model_fluxess_interp = np.array([])
+                    ds_fluxess = []
+                    ds_sigmass = []
+                    l3_fluxes = []
+                    l3_fracs = []
+                    l3_pblum_abs_sums = []
+                    model_fluxess_interp = []
 
                     for dataset in this_dsscale_datasets:
                         ds_obs = self.get_dataset(dataset, **_skip_filter_checks)
@@ -12064,28 +12160,35 @@ class Bundle(ParameterSet):
                         l3_mode = ds_obs.get_value(qualifier='l3_mode', **_skip_filter_checks)
                         if l3_mode == 'flux':
                             l3_flux = ds_obs.get_value(qualifier='l3', unit=u.W/u.m**2, **_skip_filter_checks)
-                            l3_fluxes = np.append(l3_fluxes, np.full_like(ds_times, fill_value=l3_flux))
-                            l3_fracs = np.append(l3_fracs, np.zeros_like(ds_times))
-                            l3_pblum_abs_sums = np.append(l3_pblum_abs_sums, np.zeros_like(ds_times))
+                            l3_fluxes.append(np.full_like(ds_times, fill_value=l3_flux))
+                            l3_fracs.append(np.zeros_like(ds_times))
+                            l3_pblum_abs_sums.append(np.zeros_like(ds_times))
                         else:
                             l3_frac = ds_obs.get_value(qualifier='l3_frac', **_skip_filter_checks)
-                            l3_fluxes = np.append(l3_fluxes, np.zeros_like(ds_times))
-                            l3_fracs = np.append(l3_fracs, np.full_like(ds_times, fill_value=l3_frac))
-                            l3_pblum_abs_sums = np.append(l3_pblum_abs_sums, np.full_like(ds_times, fill_value=np.sum(list(pblums_abs.get(dataset).values()))))
+                            l3_fluxes.append(np.zeros_like(ds_times))
+                            l3_fracs.append(np.full_like(ds_times, fill_value=l3_frac))
+                            l3_pblum_abs_sums.append(np.full_like(ds_times, fill_value=np.sum(list(pblums_abs.get(dataset).values()))))
 
                         ds_fluxes = ds_obs.get_value(qualifier='fluxes', unit=u.W/u.m**2, **_skip_filter_checks)
-                        ds_fluxess = np.append(ds_fluxess, ds_fluxes)
+                        ds_fluxess.append(ds_fluxes)
                         ds_sigmas = ds_obs.get_value(qualifier='sigmas', **_skip_filter_checks)
                         if len(ds_sigmas):
-                            ds_sigmass = np.append(ds_sigmass, ds_sigmas)
+                            ds_sigmass.append(ds_sigmas)
                         else:
                             sigma_est = 0.001*ds_fluxes.mean()
                             logger.warning("dataset-scaling: adopting sigmas={} for dataset='{}'".format(sigma_est, dataset))
-                            ds_sigmass = np.append(ds_sigmass, sigma_est*np.ones(len(ds_fluxes)))
+                            ds_sigmass.append(sigma_est*np.ones(len(ds_fluxes)))
 
                         ml_ds = ml_params.filter(dataset=dataset, **_skip_filter_checks)
                         model_fluxes_interp = ml_ds.get_parameter(qualifier='fluxes', dataset=dataset, **_skip_filter_checks).interp_value(times=ds_times, parent_ps=ml_ds, bundle=self, consider_gaussian_process=False)
-                        model_fluxess_interp = np.append(model_fluxess_interp, model_fluxes_interp)
+                        model_fluxess_interp.append(model_fluxes_interp)
+
+                    ds_fluxess = np.concatenate(ds_fluxess)
+                    ds_sigmass = np.concatenate(ds_sigmass)
+                    l3_fluxes = np.concatenate(l3_fluxes)
+                    l3_fracs = np.concatenate(l3_fracs)
+                    l3_pblum_abs_sums = np.concatenate(l3_pblum_abs_sums)
+                    model_fluxess_interp = np.concatenate(model_fluxess_interp)
 
                     scale_factor_approx = np.median(ds_fluxess / model_fluxess_interp)
 
@@ -13876,7 +13979,8 @@ class Bundle(ParameterSet):
                 self.get_parameter(uniqueid=constrained_uniqueid, **_skip_filter_checks).is_constraint.flip_for(uniqueid=solve_for_uniqueid)
 
         if solver_kind in ['emcee', 'dynesty']:
-            dist, _ = self.get_distribution_collection(solution=solution, context='solution', **{k:v for k,v in kwargs.items() if k in solution_ps.qualifiers})
+            solution_qualifiers = solution_ps.qualifiers
+            dist, _ = self.get_distribution_collection(solution=solution, context='solution', **{k:v for k,v in kwargs.items() if k in solution_qualifiers})
 
             for i, uniqueid_orig in enumerate(adopt_uniqueids):
                 uniqueid, index = _extract_index_from_string(uniqueid_orig)
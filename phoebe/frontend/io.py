@@ -493,7 +493,7 @@ def load_legacy(filename, add_compute_legacy=True, add_compute_phoebe=True,
         eb.add_compute('legacy')  # , compute=comid[-1])
 
     # basic filter on parameters that make no sense in phoebe 2
-    ind = [list(params[:,0]).index(s) for s in params[:,0] if ".ADJ" not in s and ".MIN" not in s and ".MAX" not in s and ".STEP" not in s and "gui_" not in s]
+    ind = [i for i, s in enumerate(params[:,0]) if ".ADJ" not in s and ".MIN" not in s and ".MAX" not in s and ".STEP" not in s and "gui_" not in s]
     params = params[ind]
 
     # determine number of lcs and rvs
@@ -582,9 +582,9 @@ def load_legacy(filename, add_compute_legacy=True, add_compute_phoebe=True,
 
 #and split into lc and rv and spot parameters
 
-    lcin = [list(params[:,0]).index(s) for s in params[:,0] if "lc" in s]
-    rvin = [list(params[:,0]).index(s) for s in params[:,0] if "rv" in s and not "proximity" in s]
-    spotin = [list(params[:,0]).index(s) for s in params[:,0] if "spots" in s]
+    lcin = [i for i, s in enumerate(params[:,0]) if "lc" in s]
+    rvin = [i for i, s in enumerate(params[:,0]) if "rv" in s and not "proximity" in s]
+    spotin = [i for i, s in enumerate(params[:,0]) if "spots" in s]
     lcpars = params[lcin]
     rvpars = params[rvin]
     spotpars = params[spotin]
@@ -1477,7 +1477,8 @@ def pass_to_legacy(eb, compute=None, **kwargs):
     # TODO: can we somehow merge these instead of needing to re-mesh between?
 
     # handle any limb-darkening interpolation
-    eb.compute_ld_coeffs(compute=compute, set_value=True, **{k:v for k,v in kwargs.items() if k in computeps.qualifiers})
+    compute_qualifiers = computeps.qualifiers
+    eb.compute_ld_coeffs(compute=compute, set_value=True, **{k:v for k,v in kwargs.items() if k in compute_qualifiers})
 
     # TODO: remove this check once https://github.com/phoebe-project/phoebe1/issues/4 is closed
     for pblum_param in eb.filter(qualifier='pblum', unit='W', **_skip_filter_checks).to_list():
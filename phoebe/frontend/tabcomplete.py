@@ -136,7 +136,7 @@ class Completer:
 
         if cmd == '.':
             # then we're looking for attributes of thisobject (PS or bundle) that start with attr
-            words = [_method_or_attr(thisobject, item) for item in dir(thisobject) if item[:len(attr)] == attr]
+            words = [_method_or_attr(thisobject, item) for item in dir(thisobject) if item.startswith(attr)]
         else:
             # then we're looking to autocomplete the twig attr for thisobject (PS or bundle)
             words = thisobject.filter_or_get(attr, autocomplete=True, **filter_kwargs)
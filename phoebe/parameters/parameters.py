@@ -27,8 +27,7 @@ import time
 import types
 import tempfile
 import subprocess
-from collections import OrderedDict
-from fnmatch import fnmatch
+from fnmatch import fnmatch, translate as _fnmatch_translate
 from copy import deepcopy as _deepcopy
 import readline
 import numpy as np
@@ -152,6 +151,17 @@ _meta_fields_twig = ['time', 'qualifier', 'feature', 'component',
 
 _meta_fields_all = _meta_fields_twig + ['twig', 'uniquetwig', 'uniqueid']
 _meta_fields_filter = _meta_fields_all + ['constraint_func', 'value']
+# tags for which ParameterSet.filter_or_get looks up parameters through a
+# hashed index (in order of preference)
+_indexed_tags = ['uniqueid', 'qualifier', 'context']
+# incremented (by _tags_changed) whenever the tags of existing Parameters are
+# changed in-place.  A Parameter can belong to any number of ParameterSets, so
+# every index built before the change must be considered stale.
+_tag_generation = 0
+
+def _tags_changed():
+    global _tag_generation
+    _tag_generation += 1
 
 _contexts = ['system', 'component', 'feature',
              'dataset', 'constraint', 'distribution', 'compute', 'model',
@@ -163,6 +173,9 @@ _contexts = ['system', 'component', 'feature',
 # components and datasets should also forbid this list
 _forbidden_labels = _deepcopy(_meta_fields_all)
 
+# immutable types which deepcopy would return as-is anyway
+_deepcopy_atomic_types = {type(None), bool, int, float, complex, str, bytes}
+
 # forbid all "contexts", although should already be in _meta_fields_all
 _forbidden_labels += _contexts
 
@@ -330,9 +343,23 @@ _forbidden_labels += ['remoteslurm', 'awsec2', 'localthread',
                       'terminate_on_complete',
                       'use_server', 'install_deps', 'slurm_job_name']
 
+# hashed copy of the (long) list for the lookup in _check_label
+_forbidden_labels_set = frozenset(_forbidden_labels)
+
 # ? and * used for wildcards in twigs
 _twig_delims = ' \t\n`~!#$%^&)-=+]{}\\|;,<>/:'
 
+# regular expressions used on every twig/constraint/hierarchy parse, compiled
+# once here instead of looked up in re's cache on every call.  Labels are
+# restricted to ascii (see _label_re), so twig words can skip unicode matching.
+_twig_words_re = re.compile(r"[\w']+", re.ASCII)
+_nonword_re = re.compile(r"[^\w]")
+_label_re = re.compile("^[a-z,A-Z,0-9,_]*$")
+_constraint_var_re = re.compile(r'\{.[^{}]*\}')
+
+# strings cast to False by BoolParameter.set_value
+_bool_false_strings = frozenset(['false', 'False', '0'])
+
 
 _singular_to_plural = {'time': 'times', 'phase': 'phases', 'flux': 'fluxes', 'sigma': 'sigmas',
                        'rv': 'rvs', 'wavelength': 'wavelengths', 'flux_density': 'flux_densities',
@@ -366,16 +393,20 @@ def _return_ps(b, ps):
         ps._filter = {'uniqueid': ps.uniqueids}
     return ps
 
+_send_if_client_fctn_map = {'set_quantity': 'set_value',
+                            'set_value': 'set_value',
+                            'set_default_unit': 'set_default_unit',
+                            'flip_for': 'flip_constraint'}
+
 def send_if_client(fctn):
     """Intercept and send to the server if bundle is in client mode."""
     @functools.wraps(fctn)
     def _send_if_client(self, *args, **kwargs):
-        fctn_map = {'set_quantity': 'set_value',
-                    'set_value': 'set_value',
-                    'set_default_unit': 'set_default_unit',
-                    'flip_for': 'flip_constraint'}
+        # NOTE: this wraps every call to set_value (and others), so the
+        # check for client mode is a single (defaulted) attribute lookup
         b = self._bundle
-        if b is not None and hasattr(b, 'is_client') and b.is_client:
+        if b is not None and getattr(b, 'is_client', False):
+            fctn_map = _send_if_client_fctn_map
             # TODO: self._filter???
             # TODO: args???
             requestid = _uniqueid(6)
@@ -426,6 +457,8 @@ def send_if_client(fctn):
     return _send_if_client
 
 
+_uniqueid_chars = string.ascii_uppercase + string.ascii_lowercase
+
 def _uniqueid(n=30):
     """Return a unique string with length n.
 
@@ -433,12 +466,40 @@ def _uniqueid(n=30):
     :return: the uniqueid
     :rtype: str
     """
-    return ''.join(random.SystemRandom().choice(
-                   string.ascii_uppercase + string.ascii_lowercase)
-                   for _ in range(n))
+    # draw all the random bytes in a single call (rather than one call to
+    # the system random source per character) and reject the bytes that
+    # would bias the choice of character
+    chars = []
+    while len(chars) < n:
+        chars += [_uniqueid_chars[b % 52] for b in os.urandom(2*n) if b < 208]
+    return ''.join(chars[:n])
 
 _clientid = 'python-'+_uniqueid(5)
 
+def _truncate_uniquetwig(uniquetwig):
+    """Truncate a uniquetwig (if necessary) to be <=30 characters."""
+    if len(uniquetwig) > 30:
+        return uniquetwig[:27]+'...'
+    else:
+        return uniquetwig
+
+def _intern_tag(value):
+    # tags are compared (and used as dictionary keys) in every filter, so
+    # intern any string tags (those read from json, for example, would
+    # otherwise be new objects) so that equal tags are also identical
+    return sys.intern(value) if isinstance(value, str) else value
+
+_dict_fields_interned = {}
+
+def _intern_dict_fields(dict_fields_other):
+    # all Parameters of the same class (and settings) have identical field
+    # lists, so share a single copy rather than storing two new lists on
+    # every Parameter
+    key = tuple(dict_fields_other)
+    if key not in _dict_fields_interned:
+        _dict_fields_interned[key] = (list(key), _meta_fields_all + list(key))
+    return _dict_fields_interned[key]
+
 def _is_unit(unit):
     return isinstance(unit, u.Unit) or isinstance(unit, u.CompositeUnit) or isinstance(unit, u.IrreducibleUnit)
 
@@ -452,6 +513,127 @@ def _value_for_constraint(item, constraintparam=None):
     else:
         return item.si.value
 
+@functools.lru_cache(maxsize=1024)
+def _compile_constraint_expr(expr):
+    # constraints are re-evaluated whenever any of their variables change, but
+    # the expression itself rarely does, so only parse each expression once
+    return compile(expr, '<constraint>', 'eval')
+
+@functools.lru_cache(maxsize=1024)
+def _constraint_expr_names(expr):
+    # the names (safe_labels of the vars and any functions) referenced by the
+    # expression, read from the compiled code object rather than by searching
+    # the expression string for each var on every evaluation
+    return frozenset(_compile_constraint_expr(expr).co_names)
+
+_constraint_math_funcs = ['sin', 'cos', 'tan', 'arcsin', 'arccos', 'arctan', 'arctan2', 'sqrt', 'log10']
+_constraint_builtin_funcs = []
+
+def _get_constraint_builtin_funcs():
+    # builtin cannot be imported at the module level (circular import), so
+    # collect its functions the first time a constraint is evaluated
+    if not len(_constraint_builtin_funcs):
+        from phoebe.constraints import builtin
+        _constraint_builtin_funcs.extend([f for f in dir(builtin) if isinstance(getattr(builtin, f), types.FunctionType)])
+    return _constraint_builtin_funcs
+
+_constraint_eval_funcs = {}
+
+def _get_constraint_eval_funcs():
+    # namespace of builtin and math functions made available to eval when
+    # evaluating a constraint expression.  This is built once and shared
+    # (eval of an expression never writes to its locals).
+    if not len(_constraint_eval_funcs):
+        from phoebe.constraints import builtin
+        _constraint_eval_funcs.update({func: getattr(builtin, func) for func in _get_constraint_builtin_funcs() + _constraint_math_funcs})
+    return _constraint_eval_funcs
+
+_constraint_eval_globals = {}
+
+def _get_constraint_eval_globals():
+    # the module namespace with the builtin and math functions on top, passed
+    # to eval as its globals so that only the values of the vars need to be
+    # passed (as its locals) for each evaluation, instead of a new copy of
+    # all of the functions.  Names still resolve exactly as if the functions
+    # were passed in the locals.
+    if not len(_constraint_eval_globals):
+        _constraint_eval_globals.update(globals())
+        _constraint_eval_globals.update(_get_constraint_eval_funcs())
+    return _constraint_eval_globals
+
+@functools.lru_cache(maxsize=1024)
+def _constraint_expr_needs_builtin(eq, include_math=True):
+    # get_result checks this (twice) on every evaluation, but the answer only
+    # depends on the expression string
+    builtin_funcs = _get_constraint_builtin_funcs() + _constraint_math_funcs if include_math else _get_constraint_builtin_funcs()
+    for func in builtin_funcs:
+        if "{}(".format(func) in eq:
+            return True
+    return False
+
+@functools.lru_cache(maxsize=None)
+def _parse_visible_if(visible_if):
+    # visible_if expressions come from the parameter definitions and so are
+    # shared by every copy of a parameter.  Split them into a tuple (or) of
+    # tuples (and) of (remove_metawargs, qualifier, value) once per expression
+    # instead of on every call to Parameter.is_visible.
+    # syntax:
+    # * visible_if = 'condition1,condition2||condition3' (where '||' is or ',' is and)
+    # * condition = '[ignore,these]qualifier:value' or 'false'
+    parsed = []
+    for visible_if_i in visible_if.split('||'):
+        parsed_i = []
+        for visible_if_ii in visible_if_i.split(','):
+            if visible_if_ii.lower() == 'false':
+                parsed_i.append((None, None, None))
+                continue
+
+            remove_metawargs = []
+            while visible_if_ii[0] == '[':
+                remove_metawargs.append(visible_if_ii[1:].split(']')[0])
+                visible_if_ii = ']'.join(visible_if_ii[1:].split(']')[1:])
+
+            qualifier, value = visible_if_ii.split(':')
+            parsed_i.append((tuple(remove_metawargs), qualifier, value))
+        parsed.append(tuple(parsed_i))
+    return tuple(parsed)
+
+@functools.lru_cache(maxsize=None)
+def _equivalent_units(unit):
+    # find_equivalent_units scans the entire astropy unit registry, but the
+    # answer only depends on the unit (and set_default_unit_all asks once per
+    # matching parameter)
+    return unit.find_equivalent_units()
+
+@functools.lru_cache(maxsize=None)
+def _unit_scale(from_unit, to_unit):
+    # no equivalencies are enabled, so converting between units is always a
+    # multiplication by this factor (astropy raises if they're incompatible)
+    return from_unit.to(to_unit)
+
+@functools.lru_cache(maxsize=None)
+def _si_scale(unit):
+    # quantity.si decomposes the unit on every call, but the factor to si
+    # only depends on the unit (quantity.si.value == quantity.value * this)
+    return unit.si.scale
+
+@functools.lru_cache(maxsize=None)
+def _solar_scale(unit):
+    # u.to_solar of a unit returns the factor to the applicable solar units
+    return u.to_solar(unit)
+
+@functools.lru_cache(maxsize=None)
+def _si_system_scale(unit):
+    # to_system searches for the simplest si representation of the unit, which
+    # is expensive and only depends on the unit
+    return unit.to_system(u.si)[0].scale
+
+@functools.lru_cache(maxsize=None)
+def _is_angle_unit(unit):
+    # physical_type has to decompose the unit to look it up, but the answer
+    # never changes for a given unit
+    return unit.physical_type == 'angle'
+
 def _extract_index_from_string(s):
     if s is None:
         return s, None
@@ -524,9 +706,39 @@ def _instance_in(obj, *types):
 
     return False
 
+@functools.lru_cache(maxsize=256)
+def _fnmatch_matcher(expression):
+    # fnmatch normalizes and looks up the compiled pattern on every call,
+    # but filter matches the same expression against every parameter
+    return re.compile(_fnmatch_translate(os.path.normcase(expression))).match
+
+@functools.lru_cache(maxsize=4096)
+def _fnmatch_choices(expression, choices):
+    # SelectParameters re-validate and re-expand the same wildcard values
+    # against the same (tuple of) choices whenever the bundle updates them
+    match = _fnmatch_matcher(expression)
+    return tuple(choice for choice in choices if match(os.path.normcase(choice)) is not None)
+
+@functools.lru_cache(maxsize=256)
+def _twig_choices_by_twiglet(choices):
+    # a twig can only match (see SelectTwigParameter._match_twig) choices
+    # which contain each of its twiglets, so index the choices by twiglet
+    # rather than testing every choice.  Choices without '@' are matched by
+    # substring instead, so are always included.
+    by_twiglet = {}
+    unsplit = []
+    for choice in choices:
+        choice_noindex, _ = _extract_index_from_string(choice)
+        if '@' in choice_noindex:
+            for twiglet in set(choice_noindex.split('@')):
+                by_twiglet.setdefault(twiglet, []).append(choice)
+        else:
+            unsplit.append(choice)
+    return {twiglet: tuple(twiglet_choices + unsplit) for twiglet, twiglet_choices in by_twiglet.items()}, tuple(unsplit)
+
 def _fnmatch(to_this, expression_or_string):
     if isinstance(expression_or_string, str) and ('*' in expression_or_string or '?' in expression_or_string):
-        return fnmatch(to_this, expression_or_string)
+        return _fnmatch_matcher(expression_or_string)(os.path.normcase(to_this)) is not None
     else:
         return expression_or_string == to_this
 
@@ -604,6 +816,8 @@ class ParameterSet(object):
         """
         self._bundle = None
         self._filter = {}
+        # lazily built by _params_with_tag
+        self._tag_indexes = {}
 
         if isinstance(params, str):
             params = json.loads(params)
@@ -635,14 +849,14 @@ class ParameterSet(object):
         self._kind = None
         self._context = None
 
-        # just as a dummy, this'll be filled and handled by to_dict()
+        # just as a dummy, this'll be filled and handled by to_dict().  This
+        # is only needed by __repr__, which calls to_dict itself, so there is
+        # no need to force an update for every new ParameterSet (ie. every
+        # filter)
         self._next_field = 'key'
 
         self._set_meta()
 
-        # force an update to _next_field
-        self.to_dict(skip_return=True)
-
         # set tab completer
         readline.set_completer(tabcomplete.Completer().complete)
         readline.set_completer_delims(_twig_delims)
@@ -650,13 +864,16 @@ class ParameterSet(object):
 
     def __repr__(self):
         """Representation for the ParameterSet."""
-        self.to_dict()  # <-- to force an update to _next_field
+        # keys calls to_dict, which also forces an update to _next_field.
+        # Building that dictionary filters the ParameterSet once per key, so
+        # only do it once.
+        keys = self.keys()
         if len(self._params):
-            if len(self.keys()) and self.keys()[0] is not None:
+            if len(keys) and keys[0] is not None:
                 return "<ParameterSet: {} parameters | {}s: {}>"\
                     .format(len(self._params),
                             self._next_field,
-                            ', '.join(self.keys()))
+                            ', '.join(keys))
             else:
                 return "<ParameterSet: {} parameters>"\
                     .format(len(self._params))
@@ -699,6 +916,19 @@ class ParameterSet(object):
     def __copy__(self):
         return self.copy()
 
+    def __deepcopy__(self, memo):
+        cls = self.__class__
+        result = cls.__new__(cls)
+        memo[id(self)] = result
+        for k, v in self.__dict__.items():
+            if k == '_tag_indexes':
+                # the indexes are rebuilt on demand, no need to copy them
+                v = {}
+            elif v.__class__ not in _deepcopy_atomic_types:
+                v = _deepcopy(v, memo)
+            result.__dict__[k] = v
+        return result
+
     @property
     def info(self):
         """
@@ -788,9 +1018,9 @@ class ParameterSet(object):
         ----------
         * (dict) an ordered dictionary of all tag properties
         """
-        return OrderedDict([(k, getattr(self, k))
-                            for k in _meta_fields_twig
-                            if k not in ignore])
+        return {k: getattr(self, k)
+                for k in _meta_fields_twig
+                if k not in ignore}
 
     def set_meta(self, **kwargs):
         """Set the value of tags for all Parameters in this ParameterSet.
@@ -805,6 +1035,7 @@ class ParameterSet(object):
                 # Here we'll set the attributes (_context, _qualifier, etc)
                 if getattr(param, '_{}'.format(k)) is None:
                     setattr(param, '_{}'.format(k), v)
+        _tags_changed()
 
     def _options_for_tag(self, tag, include_default=True):
         # keys_for_this_field = set([getattr(p, tag)
@@ -814,10 +1045,12 @@ class ParameterSet(object):
         # especially as the PS gets larger, this is actually somewhat cheaper
         # than building the large list and taking the set.
         keys_for_this_field = []
+        keys_seen = set()
         for p in self.to_list():
             key = getattr(p, tag)
-            if key is not None and key not in keys_for_this_field and (include_default or key!='_default'):
+            if key is not None and key not in keys_seen and (include_default or key!='_default'):
                 keys_for_this_field.append(key)
+                keys_seen.add(key)
 
         return keys_for_this_field
 
@@ -1433,14 +1666,23 @@ class ParameterSet(object):
         by ALL parameters in the ParameterSet.  For any fields that are
         not
         """
-        # we want to set meta-fields that are shared by ALL params in the PS
+        # we want to set meta-fields that are shared by ALL params in the PS.
+        # This runs for every new PS (ie. every filter), so rather than
+        # collecting all options for each tag, stop scanning as soon as a
+        # second value is found.
         for field in _meta_fields_twig:
-            keys_for_this_field = self._options_for_tag(field)
+            shared_key = None
+            for p in self._params:
+                key = getattr(p, field)
+                if key is None:
+                    continue
+                if shared_key is None:
+                    shared_key = key
+                elif key != shared_key:
+                    shared_key = None
+                    break
 
-            if len(keys_for_this_field)==1:
-                setattr(self, '_'+field, keys_for_this_field[0])
-            else:
-                setattr(self, '_'+field, None)
+            setattr(self, '_'+field, shared_key)
 
     def _uniquetags(self, param_or_twig, force_levels=['qualifier'], exclude_levels=[]):
         """
@@ -1551,15 +1793,17 @@ class ParameterSet(object):
 
             if new_uniqueids:
                 param._uniqueid = _uniqueid()
+                _tags_changed()
 
             for k, v in kwargs.items():
                 # Here we'll set the attributes (_context, _qualifier, etc)
                 if k in ['check_default', 'check_visible']: continue
                 if getattr(param, '_{}'.format(k)) is None or override_tags:
-                    setattr(param, '_{}'.format(k), v)
+                    setattr(param, '_{}'.format(k), _intern_tag(v))
+                    _tags_changed()
 
             if overwrite:
-                ret_changes += self.remove_parameters_all(**{k:v for k,v in param.meta.items() if k not in ['uniqueid', 'twig', 'uniquetwig']}).to_list()
+                ret_changes += self.remove_parameters_all(**param.get_meta(ignore=['uniqueid', 'twig', 'uniquetwig'])).to_list()
             self._params.append(param)
 
         if check_copy_for:
@@ -1715,10 +1959,10 @@ class ParameterSet(object):
         if not isinstance(label, str):
             label = str(label)
 
-        if label.lower() in _forbidden_labels:
+        if label.lower() in _forbidden_labels_set:
             raise ValueError("'{}' is forbidden to be used as a label"
                              .format(label))
-        if not re.match("^[a-z,A-Z,0-9,_]*$", label):
+        if not _label_re.match(label):
             raise ValueError("label '{}' is forbidden - only alphabetic, numeric, and '_' characters are allowed in labels".format(label))
         if len(self.filter(twig=label, check_visible=False)) and not allow_overwrite:
             raise ValueError("label '{}' is already in use.  Remove first or pass overwrite=True, if available.".format(label))
@@ -1737,12 +1981,15 @@ class ParameterSet(object):
             # NOTE: used to have the following but doesn't work in python3
             # because the Parameters aren't hashable:
             # return ParameterSet(list(set(self._params+other._params)))
-            lst = self._params
+            # Parameters compare (via __eq__) by uniqueid, so take the union
+            # of dictionaries keyed by uniqueid (keeping the order of self,
+            # followed by any new parameters in other).  This also avoids
+            # appending to (and therefore changing) self._params.
+            params = {p.uniqueid: p for p in self._params}
             for p in other._params:
-                if p not in lst:
-                    lst.append(p)
+                params.setdefault(p.uniqueid, p)
 
-            ps = ParameterSet(lst)
+            ps = ParameterSet(list(params.values()))
             ps._bundle = self._bundle
             return ps
         else:
@@ -1757,7 +2004,8 @@ class ParameterSet(object):
             other = ParameterSet(other)
 
         if isinstance(other, ParameterSet):
-            ps = ParameterSet([p for p in self._params if p not in other._params])
+            other_uniqueids = set(p.uniqueid for p in other._params)
+            ps = ParameterSet([p for p in self._params if p.uniqueid not in other_uniqueids])
             ps._bundle = self._bundle
             return ps
         else:
@@ -1773,7 +2021,8 @@ class ParameterSet(object):
             other = ParameterSet([other])
 
         if isinstance(other, ParameterSet):
-            ps = ParameterSet([p for p in self._params if p in other._params])
+            other_uniqueids = set(p.uniqueid for p in other._params)
+            ps = ParameterSet([p for p in self._params if p.uniqueid in other_uniqueids])
             ps._bundle = self._bundle
             return ps
         else:
@@ -1841,19 +2090,24 @@ class ParameterSet(object):
         * (string) filename
         """
         filename = os.path.expanduser(filename)
-        f = open(filename, 'w')
+        # encode to a string first and write that in one go - json.dump
+        # would otherwise call f.write for every encoded chunk
         if compact:
             if _can_ujson:
-                ujson.dump(self.to_json(incl_uniqueid=incl_uniqueid, sort_by_context=sort_by_context),
-                           f, sort_keys=False, indent=0)
+                data = ujson.dumps(self.to_json(incl_uniqueid=incl_uniqueid, sort_by_context=sort_by_context),
+                                   sort_keys=False, indent=0)
             else:
                 logger.warning("for faster compact saving, install ujson")
-                json.dump(self.to_json(incl_uniqueid=incl_uniqueid, sort_by_context=sort_by_context),
-                          f, sort_keys=False, indent=0)
+                # passing indent (even indent=0) forces json to fall back on
+                # its pure-python encoder, so write compact files on a single
+                # line with the c-encoder instead
+                data = json.dumps(self.to_json(incl_uniqueid=incl_uniqueid, sort_by_context=sort_by_context),
+                                  sort_keys=False, separators=(',', ':'))
         else:
-            json.dump(self.to_json(incl_uniqueid=incl_uniqueid, sort_by_context=sort_by_context),
-                      f, sort_keys=True, indent=0, separators=(',', ': '))
-        f.close()
+            data = json.dumps(self.to_json(incl_uniqueid=incl_uniqueid, sort_by_context=sort_by_context),
+                              sort_keys=True, indent=0, separators=(',', ': '))
+        with open(filename, 'w') as f:
+            f.write(data)
 
         return filename
 
@@ -2222,14 +2476,23 @@ class ParameterSet(object):
         # self._next field, but don't want to waste time on the actual dictionary
         # comprehension
         skip_return = kwargs.pop('skip_return', False)
+        # keys_only is used internally (by keys and __iter__) to return just
+        # the keys of the dictionary (in the same order) without filtering
+        # for each of the values
+        keys_only = kwargs.pop('keys_only', False)
 
         if kwargs:
-            return self.filter(**kwargs).to_dict(field=field)
+            return self.filter(**kwargs).to_dict(field=field, keys_only=keys_only)
 
         if field is not None:
             keys_for_this_field = self._options_for_tag(field)
             if skip_return: return
 
+            if keys_only:
+                if include_none and any(getattr(p, field) is None for p in self._params):
+                    keys_for_this_field.append(None)
+                return keys_for_this_field
+
             d =  {k: self.filter(check_visible=False, **{field: k}) for k in keys_for_this_field}
             if include_none:
                 d_None = ParameterSet([p for p in self.to_list() if getattr(p, field) is None])
@@ -2255,6 +2518,7 @@ class ParameterSet(object):
             if len(keys_for_this_field) > 1:
                 self._next_field = field
                 if skip_return: return
+                if keys_only: return list(keys_for_this_field)
                 return {k: self.filter(check_visible=False, **{field: k})
                         for k in keys_for_this_field}
 
@@ -2263,10 +2527,12 @@ class ParameterSet(object):
         if self.context in ['hierarchy']:
             self._next_field = 'qualifier'
             if skip_return: return
+            if keys_only: return list(dict.fromkeys(param.qualifier for param in self._params))
             return {param.qualifier: param for param in self._params}
         else:
             self._next_field = 'time'
             if skip_return: return
+            if keys_only: return list(dict.fromkeys(param.time for param in self._params))
             return {param.time: param for param in self._params}
 
     def keys(self):
@@ -2277,7 +2543,7 @@ class ParameterSet(object):
         ---------
         * (list) list of strings
         """
-        return list(self.to_dict().keys())
+        return self.to_dict(keys_only=True)
 
     def values(self):
         """
@@ -2330,7 +2596,7 @@ class ParameterSet(object):
         if 'index' in kwargs.keys():
             mkwargs['index'] = kwargs.pop('index')
         twig, index = _extract_index_from_string(twig)
-        twigsplit = re.findall(r"[\w']+", twig)
+        twigsplit = _twig_words_re.findall(twig)
         if twigsplit[0] == 'value':
             twig = '@'.join(twigsplit[1:])
             if index is not None:
@@ -2426,7 +2692,7 @@ class ParameterSet(object):
     def __iter__(self):
         """
         """
-        return iter(self.to_dict())
+        return iter(self.to_dict(keys_only=True))
 
     def to_json(self, incl_uniqueid=False, incl_none=False, exclude=[], sort_by_context=True):
         """
@@ -2796,7 +3062,16 @@ class ParameterSet(object):
                 return_ += self.filter_or_get(**kwargs)
             return return_
 
-        params = self.to_list()
+        # most filters (including every visibility check) are by a single
+        # qualifier and/or context, so start from the (hashed) parameters with
+        # that tag instead of scanning the entire ParameterSet
+        for tag in _indexed_tags:
+            tag_value = kwargs.get(tag, None)
+            if isinstance(tag_value, str) and not ('*' in tag_value or '?' in tag_value):
+                params = self._params_with_tag(tag, tag_value)
+                break
+        else:
+            params = self.to_list()
 
         def string_to_time(string):
             try:
@@ -2815,31 +3090,69 @@ class ParameterSet(object):
                     key in _meta_fields_filter and \
                     kwargs[key] is not None:
 
-                params = [pi for pi in params if (hasattr(pi,key) and getattr(pi,key) is not None or isinstance(kwargs[key], list) and None in kwargs[key]) and
+                if isinstance(kwargs[key], list) and key != 'value':
+                    # look up exact matches in a set and only send the entries
+                    # with wildcards through fnmatch, instead of scanning (and
+                    # fnmatching) the whole list for every parameter
+                    values_set = set(kwargs[key])
+                    values_wildcard = [v for v in kwargs[key] if isinstance(v, str) and ('*' in v or '?' in v)]
+                    if key == 'kind':
+                        values_lower = set(v.lower() for v in kwargs[key] if isinstance(v, str))
+                    values_wildcard = [_fnmatch_matcher(v) for v in values_wildcard]
+                    params = [pi for pi in params if (getattr(pi,key,None) is not None or None in values_set) and
+                        (getattr(pi,key,None) in values_set or
+                        (isinstance(getattr(pi,key,None),str) and any(match(os.path.normcase(getattr(pi,key))) is not None for match in values_wildcard)) or
+                        (key=='kind' and isinstance(getattr(pi,key,None),str) and getattr(pi,key).lower() in values_lower))]
+                    continue
+
+                if isinstance(kwargs[key], str) and key not in ['kind', 'time', 'value'] and \
+                        not ('*' in kwargs[key] or '?' in kwargs[key]):
+                    # by far the most common case: a single tag without
+                    # wildcards only needs an equality check
+                    params = [pi for pi in params if getattr(pi,key,None) == kwargs[key]]
+                    continue
+
+                if isinstance(kwargs[key], str) and key == 'kind' and \
+                        not ('*' in kwargs[key] or '?' in kwargs[key]):
+                    # kinds are matched case-insensitively, so only lower the
+                    # requested kind once rather than for every parameter
+                    kind_lower = kwargs[key].lower()
+                    params = [pi for pi in params if isinstance(pi.kind, str) and pi.kind.lower() == kind_lower]
+                    continue
+
+                params = [pi for pi in params if (getattr(pi,key,None) is not None or isinstance(kwargs[key], list) and None in kwargs[key]) and
                     (getattr(pi,key) is kwargs[key] or
                     (isinstance(kwargs[key],list) and getattr(pi,key) in kwargs[key]) or
-                    (isinstance(kwargs[key],list) and np.any([_fnmatch(getattr(pi,key),keyi) for keyi in kwargs[key]])) or
+                    (isinstance(kwargs[key],list) and any(_fnmatch(getattr(pi,key),keyi) for keyi in kwargs[key])) or
                     (isinstance(kwargs[key],str) and isinstance(getattr(pi,key),str) and _fnmatch(getattr(pi,key),kwargs[key])) or
                     (key=='kind' and isinstance(kwargs[key],str) and getattr(pi,key).lower()==kwargs[key].lower()) or
                     (key=='kind' and hasattr(kwargs[key],'__iter__') and getattr(pi,key).lower() in [k.lower() for k in kwargs[key]]) or
                     (key=='time' and abs(float(getattr(pi,key))-string_to_time(kwargs[key]))<1e-6))]
                     #(key=='time' and abs(float(getattr(pi,key))-float(kwargs[key]))<=abs(np.array([p._time for p in params])-float(kwargs[key]))))]
 
-        # handle hiding _default (cheaper than visible_if so let's do first)
-        if check_default:
-            params = [pi for pi in params if pi.component != '_default' and pi.dataset != '_default' and pi.feature != '_default']
+        def _apply_checks(params):
+            # handle hiding _default (cheaper than visible_if so let's do first)
+            if check_default:
+                params = [pi for pi in params if pi.component != '_default' and pi.dataset != '_default' and pi.feature != '_default']
+
+            # handle visible_if
+            if check_visible:
+                params = [pi for pi in params if pi.is_visible]
 
-        # handle visible_if
-        if check_visible:
-            params = [pi for pi in params if pi.is_visible]
+            # handle hiding advanced parameters
+            if check_advanced:
+                params = [pi for pi in params if not pi.advanced]
 
-        # handle hiding advanced parameters
-        if check_advanced:
-            params = [pi for pi in params if not pi.advanced]
+            # handle hiding choice parameters with a single option
+            if check_single:
+                params = [pi for pi in params if len(getattr(pi, 'choices', [None, None])) > 1]
 
-        # handle hiding choice parameters with a single option
-        if check_single:
-            params = [pi for pi in params if not hasattr(pi, 'choices') or len(pi.choices) > 1]
+            return params
+
+        if not isinstance(twig, str):
+            # otherwise these are applied after matching the twig, so that
+            # visible_if is only checked for the (few) matching parameters
+            params = _apply_checks(params)
 
         if isinstance(twig, int):
             # then act as a list index
@@ -2855,7 +3168,7 @@ class ParameterSet(object):
         method = None
         mindex = None
         if twig is not None:
-            _user_twig = _deepcopy(twig)
+            _user_twig = twig
 
             twig, index = _extract_index_from_string(twig)
 
@@ -2891,7 +3204,7 @@ class ParameterSet(object):
                 # then we want to do matching based on all but the
                 # last item in the twig and then try to autocomplete
                 # based on the last item
-                if re.findall(r"[^\w]", _user_twig[-1]):
+                if _nonword_re.search(_user_twig[-1]) is not None:
                     # then we will autocomplete on an empty entry
                     twigautocomplete = ''
                 else:
@@ -2899,26 +3212,32 @@ class ParameterSet(object):
                     twigautocomplete = twigsplit[-1]
                     twigsplit = twigsplit[:-1]
 
-            def _twigmatch(twig, ti, index):
-                if index is None:
-                    return ti in twig.split('@')
-                else:
-                    return ti in twig.split('@') or '{}[{}]'.format(ti, index) in twig.split('@')
-
+            # build (and split) the twig of each parameter once, rather than
+            # (several times) for every item in the requested twig
+            params_twiglets = [(pi, pi.twig) for pi in params]
+            params_twiglets = [(pi, twig_i, set(twig_i.split('@'))) for pi, twig_i in params_twiglets]
             for ti in twigsplit:
                 # TODO: need to fix repeating twigs (ie
                 # period@period@period@period still matches and causes problems
                 # with the tabcomplete)
-                params = [pi for pi in params if _twigmatch(pi.twig, ti, index) or _fnmatch(pi.twig, ti)]
+                ti_index = '{}[{}]'.format(ti, index) if index is not None else None
+                params_twiglets = [(pi, twig_i, twiglets) for pi, twig_i, twiglets in params_twiglets
+                                   if ti in twiglets or ti_index in twiglets or _fnmatch(twig_i, ti)]
+            params = _apply_checks([pi for pi, twig_i, twiglets in params_twiglets])
 
             if autocomplete:
                 # we want to provide options for what twigautomplete
                 # could be to produce matches
                 options = []
+                n_autocomplete = len(twigautocomplete)
+                twigs_by_id = {id(pi): twig_i for pi, twig_i, twiglets in params_twiglets}
                 for pi in params:
-                    for twiglet in pi.twig.split('@'):
-                        if twigautocomplete == twiglet[:len(twigautocomplete)]:
-                            if len(twigautocomplete):
+                    for twiglet in twigs_by_id[id(pi)].split('@'):
+                        # twiglets shorter than the entry cannot complete it
+                        if len(twiglet) < n_autocomplete:
+                            continue
+                        if twiglet.startswith(twigautocomplete):
+                            if n_autocomplete:
                                 completed_twig = _user_twig.replace(twigautocomplete, twiglet)
                             else:
                                 completed_twig = _user_twig + twiglet
@@ -2928,6 +3247,19 @@ class ParameterSet(object):
 
         return _return(params, force_ps, method, mindex)
 
+    def _params_with_tag(self, tag, value):
+        # the index for each tag is rebuilt whenever _params has been appended
+        # to or replaced, or whenever the tags of any Parameter have changed
+        # in-place (see _tags_changed) since the index was built.
+        index = self._tag_indexes.get(tag)
+        if index is None or index[0] is not self._params or index[1] != len(self._params) or index[2] != _tag_generation:
+            params_by_value = {}
+            for param in self._params:
+                params_by_value.setdefault(getattr(param, tag), []).append(param)
+            index = (self._params, len(self._params), _tag_generation, params_by_value)
+            self._tag_indexes[tag] = index
+        return list(index[3].get(value, []))
+
     def exclude(self, twig=None, check_visible=False, check_default=False, **kwargs):
         """
         Exclude the results from this filter from the current
@@ -3281,10 +3613,15 @@ class ParameterSet(object):
         # TODO: for time derivatives will need to use t instead of time (time
         # gets passed to twig filtering)
 
+        param = None
         if default is not None:
             # then we need to do a filter first to see if parameter exists
-            if not len(self.filter(twig=twig, **kwargs)):
+            ps = self.filter(twig=twig, **kwargs)
+            if not len(ps):
                 return default
+            elif len(ps) == 1:
+                # no need to filter again through get_parameter below
+                param = ps._params[0]
 
         twig, index = _extract_index_from_string(twig)
         if kwargs.get('qualifier', None):
@@ -3292,7 +3629,8 @@ class ParameterSet(object):
         if kwargs.get('uniqueid', None):
             kwargs['uniqueid'], index = _extract_index_from_string(kwargs.get('uniqueid'))
 
-        param = self.get_parameter(twig=twig, **kwargs)
+        if param is None:
+            param = self.get_parameter(twig=twig, **kwargs)
 
         # if hasattr(param, 'default_unit'):
         # This breaks for constraint parameters
@@ -3313,6 +3651,85 @@ class ParameterSet(object):
 
         return param.get_value(**kwargs)
 
+    def _get_values_by_uniqueid(self, uniqueids, units=None):
+        """
+        Get the values of many parameters by uniqueid (each optionally with an
+        index) with a single pass over the ParameterSet, rather than a full
+        filter for every uniqueid as would be done by calling
+        <phoebe.parameters.ParameterSet.get_value> in a loop.
+
+        Arguments
+        ----------
+        * `uniqueids` (list of strings): uniqueids of the parameters.
+        * `units` (list, optional, default=None): units in which to return the
+            value of each (float) parameter.  If None, default units will be used.
+
+        Returns
+        --------
+        * (list) values in the same order as `uniqueids`.
+
+        Raises
+        ---------
+        * ValueError: if no parameter matches one of the uniqueids.
+        """
+        if units is None:
+            units = [None]*len(uniqueids)
+
+        params = {param.uniqueid: param for param in self._params}
+
+        values = []
+        for uniqueid, unit in zip(uniqueids, units):
+            uniqueid, index = _extract_index_from_string(uniqueid)
+            param = params.get(uniqueid, None)
+            if param is None:
+                raise ValueError("0 results found for uniqueid={}".format(uniqueid))
+
+            if isinstance(param, FloatParameter):
+                value = param.get_value(unit=unit)
+                if index is not None:
+                    if not isinstance(param, FloatArrayParameter):
+                        raise ValueError("indices only supported for FloatArrayParameter")
+                    value = value[index]
+            elif index is not None:
+                raise ValueError("indices only supported for FloatArrayParameter")
+            else:
+                value = param.get_value()
+
+            values.append(value)
+
+        return values
+
+    def _set_values_by_uniqueid(self, uniqueids, values, **kwargs):
+        """
+        Set the values of many parameters by uniqueid (each optionally with an
+        index) with a single pass over the ParameterSet, rather than a full
+        filter for every uniqueid as would be done by calling
+        <phoebe.parameters.ParameterSet.set_value> in a loop.
+
+        Arguments
+        ----------
+        * `uniqueids` (list of strings): uniqueids of the parameters.
+        * `values` (list): values to set, in the same order as `uniqueids`.
+        * `**kwargs`: passed on to <phoebe.parameters.Parameter.set_value>
+            (or <phoebe.parameters.FloatArrayParameter.set_index_value>).
+
+        Raises
+        ---------
+        * ValueError: if no parameter matches one of the uniqueids.
+        """
+        params = {param.uniqueid: param for param in self._params}
+
+        for uniqueid, value in zip(uniqueids, values):
+            uniqueid, index = _extract_index_from_string(uniqueid)
+            param = params.get(uniqueid, None)
+            if param is None:
+                raise ValueError("0 results found for uniqueid={}".format(uniqueid))
+
+            if index is not None:
+                param.set_index_value(index=index, value=value, **kwargs)
+            else:
+                param.set_value(value=value, **kwargs)
+
     def set_value(self, twig=None, value=None, **kwargs):
         """
         Set the value of a <phoebe.parameters.Parameter> in this
@@ -4218,7 +4635,7 @@ class ParameterSet(object):
                     # this will likely be a little expensive, but we only do it
                     # in the case where a dictionary is passed.
                     logger.debug("_unpack_plotting_kwargs: trying to find match for dictionary {}={} in kwargs against meta={}.  match={}".format(k,v,meta,match))
-                    if np.all([np.any([_fnmatch(mv, kksplit) for mv in meta.values() if mv is not None]) for kksplit in kk.split('@')]):
+                    if all(any(_fnmatch(mv, kksplit) for mv in meta.values() if mv is not None) for kksplit in kk.split('@')):
                         if match is not None:
                             raise ValueError("dictionary {}={} is not unique for {}".format(k,v, meta))
                         match = vv
@@ -6219,7 +6636,8 @@ class Parameter(object):
             <phoebe.parameters.Parameter.is_visible>
         """
 
-        uniqueid = str(kwargs.get('uniqueid', _uniqueid()))
+        uniqueid = kwargs.get('uniqueid', None)
+        uniqueid = str(uniqueid) if uniqueid is not None else _uniqueid()
         bundle = kwargs.get('bundle', None)
 
         self._in_constraints = []   # labels of constraints that have this parameter in the expression
@@ -6233,22 +6651,22 @@ class Parameter(object):
 
         # Meta-data
         self.set_uniqueid(uniqueid)
-        self._qualifier = qualifier
+        self._qualifier = _intern_tag(qualifier)
         self._time = kwargs.get('time', None)
-        self._feature = kwargs.get('feature', None)
-        self._component = kwargs.get('component', None)
-        self._dataset = kwargs.get('dataset', None)
-        self._figure = kwargs.get('figure', None)
-        self._server = kwargs.get('server', None)
-        self._constraint = kwargs.get('constraint', None)
-        self._distribution = kwargs.get('distribution', None)
-        self._compute = kwargs.get('compute', None)
-        self._model = kwargs.get('model', None)
-        self._solver = kwargs.get('solver', None)
-        self._solution = kwargs.get('solution', None)
+        self._feature = _intern_tag(kwargs.get('feature', None))
+        self._component = _intern_tag(kwargs.get('component', None))
+        self._dataset = _intern_tag(kwargs.get('dataset', None))
+        self._figure = _intern_tag(kwargs.get('figure', None))
+        self._server = _intern_tag(kwargs.get('server', None))
+        self._constraint = _intern_tag(kwargs.get('constraint', None))
+        self._distribution = _intern_tag(kwargs.get('distribution', None))
+        self._compute = _intern_tag(kwargs.get('compute', None))
+        self._model = _intern_tag(kwargs.get('model', None))
+        self._solver = _intern_tag(kwargs.get('solver', None))
+        self._solution = _intern_tag(kwargs.get('solution', None))
         # self._plugin = kwargs.get('plugin', None)
-        self._kind = kwargs.get('kind', None)
-        self._context = kwargs.get('context', None)
+        self._kind = _intern_tag(kwargs.get('kind', None))
+        self._context = _intern_tag(kwargs.get('context', None))
 
         self._latexfmt = kwargs.get('latexfmt', None)
 
@@ -6260,17 +6678,7 @@ class Parameter(object):
         self._visible_if = kwargs.get('visible_if', None)
 
         self._dict_fields_other = ['description', 'value', 'visible_if', 'copy_for', 'readonly', 'advanced', 'latexfmt']
-        self._dict_fields = _meta_fields_all + self._dict_fields_other
-
-        # loading from json can result in unicodes instead of strings - this then
-        # causes problems with a lot of isinstances and string-matching.
-        for attr in _meta_fields_twig + self._dict_fields_other:
-            attr = '_{}'.format(attr)
-            val = getattr(self, attr)
-
-            #if attr == '_copy_for' and isinstance(self._copy_for, str):
-            #    print "***", self._copy_for
-            #    self._copy_for = json.loads(self._copy_for)
+        self._dict_fields_other, self._dict_fields = _intern_dict_fields(self._dict_fields_other)
 
     @classmethod
     def _from_json(cls, bundle=None, **kwargs):
@@ -6291,12 +6699,13 @@ class Parameter(object):
         """
         if isinstance(self._value, nparray.ndarray):
             quantity = self._value
-        elif hasattr(self, 'quantity'):
+        elif isinstance(self, FloatParameter):
+            # NOTE: hasattr(self, 'quantity') would evaluate get_quantity
             quantity = self.get_quantity()
         else:
             quantity = self.get_value()
 
-        if hasattr(self, 'constraint') and self.constraint is not None:
+        if getattr(self, 'constraint', None) is not None:
             return "<Parameter: {}={} (constrained) | keys: {}>".format(self.qualifier, quantity.__repr__() if isinstance(quantity, distl._distl.BaseDistlObject) else quantity, ', '.join(self._dict_fields_other))
         else:
             return "<Parameter: {}={} | keys: {}>".format(self.qualifier, quantity.__repr__() if isinstance(quantity, distl._distl.BaseDistlObject) else quantity, ', '.join(self._dict_fields_other))
@@ -6306,7 +6715,8 @@ class Parameter(object):
         """
         if isinstance(self._value, nparray.ndarray):
             quantity = self._value
-        elif hasattr(self, 'quantity'):
+        elif isinstance(self, FloatParameter):
+            # NOTE: hasattr(self, 'quantity') would evaluate get_quantity
             quantity = self.get_quantity()
         else:
             quantity = self.get_value()
@@ -6316,14 +6726,20 @@ class Parameter(object):
         str_ += "{:>32}: {}\n".format("Description", self.description)
         str_ += "{:>32}: {}\n".format("Value", quantity.__repr__() if isinstance(quantity, distl._distl.BaseDistlObject) else quantity)
 
-        if hasattr(self, 'choices'):
-            str_ += "{:>32}: {}\n".format("Choices", ", ".join(self.choices))
-        if hasattr(self, 'constrained_by'):
-            str_ += "{:>32}: {}\n".format("Constrained by", ", ".join([p.uniquetwig for p in self.constrained_by]) if self.constrained_by is not None else 'None')
-        if hasattr(self, 'constrains'):
-            str_ += "{:>32}: {}\n".format("Constrains", ", ".join([p.uniquetwig for p in self.constrains]) if len(self.constrains) else 'None')
-        if hasattr(self, 'related_to'):
-            str_ += "{:>32}: {}\n".format("Related to", ", ".join([p.uniquetwig for p in self.related_to]) if len(self.related_to) else 'None')
+        # NOTE: these are properties which require filtering the bundle, so
+        # only evaluate each once (hasattr would evaluate them as well)
+        choices = getattr(self, 'choices', None)
+        if choices is not None:
+            str_ += "{:>32}: {}\n".format("Choices", ", ".join(choices))
+        constrained_by = getattr(self, 'constrained_by', None)
+        if constrained_by is not None:
+            str_ += "{:>32}: {}\n".format("Constrained by", ", ".join([p.uniquetwig for p in constrained_by]))
+        constrains = getattr(self, 'constrains', None)
+        if constrains is not None:
+            str_ += "{:>32}: {}\n".format("Constrains", ", ".join([p.uniquetwig for p in constrains]) if len(constrains) else 'None')
+        related_to = getattr(self, 'related_to', None)
+        if related_to is not None:
+            str_ += "{:>32}: {}\n".format("Related to", ", ".join([p.uniquetwig for p in related_to]) if len(related_to) else 'None')
         if self.visible_if is not None:
             str_ += "{:>32}: {}\n".format("Only visible if", self.visible_if)
 
@@ -6340,7 +6756,7 @@ class Parameter(object):
             return getattr(self.get_value(), comp)(other)
         elif isinstance(other, u.Quantity):
             return getattr(self.get_quantity(), comp)(other)
-        elif isinstance(other, str) and isinstance(self.get_value(), str) and comp in ['__eq__', '__ne__']:
+        elif isinstance(other, str) and comp in ['__eq__', '__ne__'] and isinstance(self.get_value(), str):
             return getattr(self.get_value(), comp)(other)
         elif isinstance(other, tuple) and len(other)==2 and (isinstance(other[0], float) or isinstance(other[0], int)) and isinstance(other[1], str):
             return self.__comp__(other[0]*u.Unit(other[1]), comp)
@@ -6374,6 +6790,16 @@ class Parameter(object):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __deepcopy__(self, memo):
+        # most attributes are tags (strings or None), so avoid going through
+        # deepcopy (and its memo) for each of those
+        cls = self.__class__
+        result = cls.__new__(cls)
+        memo[id(self)] = result
+        for k, v in self.__dict__.items():
+            result.__dict__[k] = v if v.__class__ in _deepcopy_atomic_types else _deepcopy(v, memo)
+        return result
+
     def copy(self):
         """
         Deepcopy the <phoebe.parameters.Parameter> (with a new uniqueid).
@@ -6424,15 +6850,21 @@ class Parameter(object):
         --------
         * (str): the string representation
         """
-        if hasattr(self, 'constrained_by') and len(self.constrained_by) > 0:
+        return self._to_string_short(self.uniquetwig)
+
+    def _to_string_short(self, uniquetwig):
+        # uniquetwig requires filtering the parent bundle multiple times, so
+        # allow subclasses that also need it (to set the line width) to
+        # compute it only once and pass it along.
+        if self._is_constraint is not None and len(self.constrained_by) > 0:
             prefix = 'C '
         elif self.readonly:
             prefix = 'R '
         else:
             prefix = '  '
 
-        quantity = self.get_quantity() if hasattr(self, 'quantity') else self.get_value()
-        return "{} {:>30}: {}".format(prefix, self.uniquetwig_trunc, quantity.__repr__() if isinstance(quantity, distl._distl.BaseDistlObject) else quantity)
+        quantity = self.get_quantity() if isinstance(self, FloatParameter) else self.get_value()
+        return "{} {:>30}: {}".format(prefix, _truncate_uniquetwig(uniquetwig), quantity.__repr__() if isinstance(quantity, distl._distl.BaseDistlObject) else quantity)
 
     # @property
     # def __dict__(self):
@@ -6495,9 +6927,8 @@ class Parameter(object):
             data = json.loads(filename)
         else:
             filename = os.path.expanduser(filename)
-            f = open(filename, 'r')
-            data = json.load(f, object_pairs_hook=parse_json)
-            f.close()
+            with open(filename, 'r') as f:
+                data = json.load(f, object_pairs_hook=parse_json)
         return cls(data)
 
     def save(self, filename, incl_uniqueid=False):
@@ -6520,10 +6951,10 @@ class Parameter(object):
         * (string) filename
         """
         filename = os.path.expanduser(filename)
-        f = open(filename, 'w')
-        json.dump(self.to_json(incl_uniqueid=incl_uniqueid),
-                  f, sort_keys=True, indent=0, separators=(',', ': '))
-        f.close()
+        data = json.dumps(self.to_json(incl_uniqueid=incl_uniqueid),
+                          sort_keys=True, indent=0, separators=(',', ': '))
+        with open(filename, 'w') as f:
+            f.write(data)
 
         return filename
 
@@ -6647,7 +7078,7 @@ class Parameter(object):
         ----------
         * (dict) an ordered dictionary of tag properties
         """
-        return OrderedDict([(k, getattr(self, k)) for k in _meta_fields_all if k not in ignore])
+        return {k: getattr(self, k) for k in _meta_fields_all if k not in ignore}
 
     @property
     def tags(self):
@@ -7002,11 +7433,7 @@ class Parameter(object):
         --------
         * (str) the uniquetwig, truncated to 12 characters
         """
-        uniquetwig = self.uniquetwig
-        if len(uniquetwig) > 30:
-            return uniquetwig[:27]+'...'
-        else:
-            return uniquetwig
+        return _truncate_uniquetwig(self.uniquetwig)
 
 
     @property
@@ -7240,22 +7667,16 @@ class Parameter(object):
         --------
         * (bool):  whether this parameter is currently visible
         """
-        def is_visible_single(visible_if):
-            # visible_if syntax:
+        def is_visible_single(remove_metawargs, qualifier, value):
+            # visible_if syntax (already split by _parse_visible_if):
             # * [ignore,these]qualifier:value
             # * [ignore,these]qualifier:<tag>
-            # print("is_visible_single {}".format(visible_if))
 
-            if visible_if.lower() == 'false':
+            if qualifier is None:
+                # visible_if was 'false'
                 return False
 
             # otherwise we need to find the parameter we're referencing and check its value
-            remove_metawargs = []
-            while visible_if[0] == '[':
-                remove_metawargs.append(visible_if[1:].split(']')[0])
-                visible_if = ']'.join(visible_if[1:].split(']')[1:])
-
-            qualifier, value = visible_if.split(':')
 
             if 'hierarchy.' in qualifier:
                 # TODO: set specific syntax (hierarchy.get_meshables:2)
@@ -7286,7 +7707,7 @@ class Parameter(object):
 
                 # the parameter needs to have all the same meta data except qualifier
                 # TODO: switch this to use self.get_parent_ps ?
-                metawargs = {k:v for k,v in self.get_meta(ignore=['twig', 'uniquetwig', 'uniqueid']+remove_metawargs).items() if v is not None}
+                metawargs = {k:v for k,v in self.get_meta(ignore=['twig', 'uniquetwig', 'uniqueid']+list(remove_metawargs)).items() if v is not None}
                 metawargs['qualifier'] = qualifier
                 # metawargs['twig'] = None
                 # metawargs['uniquetwig'] = None
@@ -7353,7 +7774,7 @@ class Parameter(object):
 
         # syntax:
         # * visible_if = 'condition1,condition2||condition3' (where '||' is or ',' is and)
-        return np.any([np.all([is_visible_single(visible_if_ii) for visible_if_ii in visible_if_i.split(',')]) for visible_if_i in visible_if.split('||')])
+        return any(all(is_visible_single(*condition) for condition in conditions) for conditions in _parse_visible_if(visible_if))
 
 
 
@@ -7443,7 +7864,7 @@ class Parameter(object):
         if self._bundle is None:
             return None
 
-        metawargs = {k:v for k,v in self.meta.items() if k not in ['qualifier', 'twig', 'uniquetwig']}
+        metawargs = dict(self.get_meta(ignore=['uniqueid', 'qualifier', 'twig', 'uniquetwig']))
 
         return self._bundle.filter(check_visible=False, check_default=False, **metawargs)
 
@@ -7785,6 +8206,7 @@ class Parameter(object):
         """
         # TODO: check to make sure uniqueid is valid (is actually unique within self._bundle and won't cause problems with constraints, etc)
         self._uniqueid = uniqueid
+        _tags_changed()
 
     def get_value(self, *args, **kwargs):
         """
@@ -7863,7 +8285,7 @@ class StringParameter(Parameter):
         self.set_value(kwargs.get('value', ''), ignore_readonly=True)
 
         self._dict_fields_other = ['description', 'value', 'visible_if', 'copy_for', 'readonly', 'advanced', 'latexfmt']
-        self._dict_fields = _meta_fields_all + self._dict_fields_other
+        self._dict_fields_other, self._dict_fields = _intern_dict_fields(self._dict_fields_other)
 
     def get_value(self, **kwargs):
         """
@@ -7908,8 +8330,6 @@ class StringParameter(Parameter):
         """
         self._readonly_check(**kwargs)
 
-        _orig_value = _deepcopy(value)
-
         try:
             value = str(value)
         except:
@@ -7937,7 +8357,7 @@ class TwigParameter(Parameter):
         self.set_value(kwargs.get('value', ''), ignore_readonly=True)
 
         self._dict_fields_other = ['description', 'value', 'visible_if', 'copy_for', 'readonly', 'advanced', 'latexfmt']
-        self._dict_fields = _meta_fields_all + self._dict_fields_other
+        self._dict_fields_other, self._dict_fields = _intern_dict_fields(self._dict_fields_other)
 
     def get_parameter(self):
         """
@@ -7999,8 +8419,6 @@ class TwigParameter(Parameter):
         """
         self._readonly_check(**kwargs)
 
-        _orig_value = _deepcopy(self.get_value())
-
         # first make sure only returns one results
         if self._bundle is None:
             raise ValueError("TwigParameters must be attached from the bundle, and cannot be standalone")
@@ -8027,7 +8445,7 @@ class ChoiceParameter(Parameter):
         self.set_value(kwargs.get('value', ''), ignore_readonly=True, allow_not_in_choices=True)
 
         self._dict_fields_other = ['description', 'choices', 'value', 'visible_if', 'copy_for', 'readonly', 'advanced', 'latexfmt']
-        self._dict_fields = _meta_fields_all + self._dict_fields_other
+        self._dict_fields_other, self._dict_fields = _intern_dict_fields(self._dict_fields_other)
 
     @property
     def choices(self):
@@ -8108,8 +8526,6 @@ class ChoiceParameter(Parameter):
         """
         self._readonly_check(**kwargs)
 
-        _orig_value = _deepcopy(self.get_value())
-
         try:
             value = str(value)
         except:
@@ -8196,7 +8612,7 @@ class SelectParameter(Parameter):
         self.set_value(kwargs.get('value', []), ignore_readonly=True)
 
         self._dict_fields_other = ['description', 'choices', 'value', 'visible_if', 'readonly', 'copy_for', 'latexfmt']
-        self._dict_fields = _meta_fields_all + self._dict_fields_other
+        self._dict_fields_other, self._dict_fields = _intern_dict_fields(self._dict_fields_other)
 
     @property
     def choices(self):
@@ -8246,7 +8662,7 @@ class SelectParameter(Parameter):
         * (bool): whether `value` is valid given the choices.
         """
         if isinstance(value, list):
-            return np.all([self.valid_selection(v) for v in value])
+            return all(self.valid_selection(v) for v in value)
 
         if value in self.choices:
             return True
@@ -8254,12 +8670,13 @@ class SelectParameter(Parameter):
         if value == '*':
             return True
 
-        # allow for wildcards
-        for choice in self.choices:
-            if _fnmatch(choice, value):
-                return True
+        # without wildcards, value could only have matched a choice exactly
+        # (which was already checked above), so skip the scan over all choices
+        if not isinstance(value, str) or not ('*' in value or '?' in value):
+            return False
 
-        return False
+        # allow for wildcards
+        return len(_fnmatch_choices(value, tuple(self.choices))) > 0
 
     def get_value(self, expand=False, **kwargs):
         """
@@ -8328,13 +8745,24 @@ class SelectParameter(Parameter):
         --------
         * (list) the current or overridden value of the Parameter
         """
+        choices = tuple(self.choices)
+        choices_set = set(choices)
         selection = []
+        selected = set()
         for v in self.get_value(**kwargs):
-            for choice in self.choices:
-                if v==choice and choice not in selection and len(choice):
-                    selection.append(choice)
-                elif _fnmatch(choice, v) and choice not in selection and len(choice):
+            if isinstance(v, str) and ('*' in v or '?' in v):
+                matches = _fnmatch_choices(v, choices)
+            elif v in choices_set:
+                # exact entries can only match themselves, so skip the scan
+                # over all choices
+                matches = [v]
+            else:
+                continue
+
+            for choice in matches:
+                if choice not in selected and len(choice):
                     selection.append(choice)
+                    selected.add(choice)
 
         return selection
 
@@ -8366,8 +8794,6 @@ class SelectParameter(Parameter):
         """
         self._readonly_check(**kwargs)
 
-        _orig_value = _deepcopy(self.get_value())
-
         if isinstance(value, str):
             value = [value]
 
@@ -8422,7 +8848,7 @@ class SelectParameter(Parameter):
             return changed or len(value_orig) != len(value)
 
         else:
-            if np.any([not self.is_valid_selection(v) for v in value]):
+            if any(not self.is_valid_selection(v) for v in value):
                 raise ValueError("not all are valid after renaming")
 
             self.set_value(value, run_checks=False, ignore_readonly=True)
@@ -8473,7 +8899,7 @@ class SelectTwigParameter(SelectParameter):
             value = value.split('@')
         if '@' in choice:
             choice = choice.split('@')
-        return np.all([vs in choice for vs in value]) and (valueindex is None or valueindex == choiceindex)
+        return all(vs in choice for vs in value) and (valueindex is None or valueindex == choiceindex)
 
     def valid_selection(self, value):
         """
@@ -8498,7 +8924,7 @@ class SelectTwigParameter(SelectParameter):
         * (bool): whether `value` is valid given the choices.
         """
         if isinstance(value, list):
-            return np.all([self.valid_selection(v) for v in value])
+            return all(self.valid_selection(v) for v in value)
 
         if super(SelectTwigParameter, self).valid_selection(value):
             return True
@@ -8508,7 +8934,8 @@ class SelectTwigParameter(SelectParameter):
         twigsplit = value.split('@')
 
         # need to do special twig matching
-        for choice in self.choices:
+        by_twiglet, unsplit = _twig_choices_by_twiglet(tuple(self.choices))
+        for choice in by_twiglet.get(twigsplit[0], unsplit):
             if self._match_twig(twigsplit, index, choice):
                 return True
 
@@ -8544,16 +8971,19 @@ class SelectTwigParameter(SelectParameter):
         * (list) the current or overridden value of the Parameter
         """
 
+        choices = self.choices
+        by_twiglet, unsplit = _twig_choices_by_twiglet(tuple(choices))
         selection = []
         for v in self.get_value(**kwargs):
             v, index = _extract_index_from_string(v)
             vsplit = v.split('@')
-            for choice in self.choices:
+            twig_candidates = set(by_twiglet.get(vsplit[0], unsplit))
+            for choice in choices:
                 if v==choice and choice not in selection and len(choice):
                     selection.append(choice)
                 elif _fnmatch(choice, v) and choice not in selection and len(choice):
                     selection.append(choice)
-                elif self._match_twig(vsplit, index, choice) and choice not in selection and len(choice):
+                elif choice in twig_candidates and self._match_twig(vsplit, index, choice) and choice not in selection and len(choice):
                     selection.append(choice)
 
 
@@ -8570,7 +9000,7 @@ class BoolParameter(Parameter):
         self.set_value(kwargs.get('value', True), ignore_readonly=True)
 
         self._dict_fields_other = ['description', 'value', 'visible_if', 'copy_for', 'readonly', 'advanced', 'latexfmt']
-        self._dict_fields = _meta_fields_all + self._dict_fields_other
+        self._dict_fields_other, self._dict_fields = _intern_dict_fields(self._dict_fields_other)
 
     def get_value(self, **kwargs):
         """
@@ -8618,9 +9048,12 @@ class BoolParameter(Parameter):
         """
         self._readonly_check(**kwargs)
 
-        _orig_value = _deepcopy(self.get_value())
+        if isinstance(value, bool):
+            # already a boolean, so no need to check for string casting
+            self._value = value
+            return
 
-        if value in ['false', 'False', '0']:
+        if isinstance(value, str) and value in _bool_false_strings:
             value = False
 
         try:
@@ -8642,7 +9075,7 @@ class UnitParameter(ChoiceParameter):
         self._value = value
 
         self._dict_fields_other = ['description', 'value', 'visible_if', 'copy_for', 'readonly', 'advanced', 'latexfmt']
-        self._dict_fields = _meta_fields_all + self._dict_fields_other
+        self._dict_fields_other, self._dict_fields = _intern_dict_fields(self._dict_fields_other)
 
     def _check_type(self, value):
         if isinstance(value, u.Unit) or isinstance(value, u.CompositeUnit) or isinstance(value, u.IrreducibleUnit):
@@ -8699,8 +9132,6 @@ class UnitParameter(ChoiceParameter):
         """
         self._readonly_check(**kwargs)
 
-        _orig_value = _deepcopy(self.get_value())
-
         value = self._check_type(value)
 
         if value not in self.choices and not kwargs.get('allow_not_in_choices', False):
@@ -8721,7 +9152,7 @@ class DictParameter(Parameter):
         self.set_value(kwargs.get('value', {}), ignore_readonly=True)
 
         self._dict_fields_other = ['description', 'value', 'visible_if', 'copy_for', 'readonly', 'advanced', 'latexfmt']
-        self._dict_fields = _meta_fields_all + self._dict_fields_other
+        self._dict_fields_other, self._dict_fields = _intern_dict_fields(self._dict_fields_other)
 
     def get_value(self, **kwargs):
         """
@@ -8766,8 +9197,6 @@ class DictParameter(Parameter):
         """
         self._readonly_check(**kwargs)
 
-        _orig_value = _deepcopy(self.get_value())
-
         try:
             value = dict(value)
         except:
@@ -8789,7 +9218,7 @@ class IntParameter(Parameter):
         self.set_value(kwargs.get('value', 1), ignore_readonly=True)
 
         self._dict_fields_other = ['description', 'value', 'limits', 'visible_if', 'copy_for', 'readonly', 'advanced', 'latexfmt']
-        self._dict_fields = _meta_fields_all + self._dict_fields_other
+        self._dict_fields_other, self._dict_fields = _intern_dict_fields(self._dict_fields_other)
 
     @property
     def limits(self):
@@ -8933,8 +9362,6 @@ class IntParameter(Parameter):
         """
         self._readonly_check(**kwargs)
 
-        _orig_value = _deepcopy(self.get_value())
-
         value = self._check_value(value)
 
         self._value = value
@@ -8960,7 +9387,7 @@ class DistributionParameter(Parameter):
         self.set_value(value, ignore_readonly=True)
 
         self._dict_fields_other = ['description', 'value', 'visible_if', 'copy_for', 'readonly', 'advanced', 'latexfmt']
-        self._dict_fields = _meta_fields_all + self._dict_fields_other
+        self._dict_fields_other, self._dict_fields = _intern_dict_fields(self._dict_fields_other)
 
     def get_referenced_parameter(self):
         """
@@ -8971,10 +9398,13 @@ class DistributionParameter(Parameter):
         * <phoebe.parameters.Parameter> object
         """
         qualifier, index = _extract_index_from_string(self.qualifier)
-        return self._bundle.exclude(context=['distribution', 'constraint'],
-                                    check_visible=False).get_parameter(qualifier=qualifier,
-                                          check_visible=False,
-                                          **{k:v for k,v in self.meta.items() if k in _contexts and k not in ['context', 'distribution']})
+        # filter on the qualifier first (which only needs to look at the few
+        # parameters sharing that qualifier) and then exclude the contexts,
+        # rather than excluding the contexts from the entire bundle
+        return self._bundle.filter(qualifier=qualifier,
+                                   check_visible=False,
+                                   **{k:v for k,v in self.get_meta(ignore=['uniqueid', 'twig', 'uniquetwig']).items() if k in _contexts and k not in ['context', 'distribution']}).exclude(context=['distribution', 'constraint'],
+                                   check_visible=False).get_parameter(check_visible=False)
 
     def lnp(self, value=None):
         """
@@ -9068,7 +9498,6 @@ class DistributionParameter(Parameter):
         """
         self._readonly_check(**kwargs)
 
-        _orig_value = _deepcopy(self.get_value())
         value = self._check_value(value)
 
         ref_param = self.get_referenced_parameter()
@@ -9127,6 +9556,8 @@ class FloatParameter(Parameter):
         """
         super(FloatParameter, self).__init__(*args, **kwargs)
 
+        self._get_value_cache = None
+
         default_unit = kwargs.get('default_unit', None)
         self.set_default_unit(default_unit)
 
@@ -9151,7 +9582,7 @@ class FloatParameter(Parameter):
             # in string representations.
             self._dict_fields_other += ['timederiv']
 
-        self._dict_fields = _meta_fields_all + self._dict_fields_other
+        self._dict_fields_other, self._dict_fields = _intern_dict_fields(self._dict_fields_other)
 
     @property
     def valid_units(self):
@@ -9181,7 +9612,9 @@ class FloatParameter(Parameter):
         -----------
         * (list)
         """
-        return self.default_unit.find_equivalent_units()
+        equivalent_units = _equivalent_units(self.default_unit)
+        # return a copy so the cached list can't be modified by the caller
+        return equivalent_units.__class__(equivalent_units)
 
     @property
     def default_unit(self):
@@ -9245,7 +9678,7 @@ class FloatParameter(Parameter):
         if not _is_unit(unit):
             raise TypeError("unit must be a Unit")
 
-        if hasattr(self, '_default_unit') and self._default_unit is not None:
+        if getattr(self, '_default_unit', None) is not None and unit != self._default_unit:
             # we won't use a try except here so that the error comes from astropy
             check_convert = self._default_unit.to(unit)
 
@@ -9341,10 +9774,27 @@ class FloatParameter(Parameter):
         * (bool): whether `value` is valid according to the limits.
         """
 
+        lower, upper = self.limits
+        if lower is None and upper is None:
+            return True
+
+        if isinstance(lower, (u.Quantity, type(None))) and isinstance(upper, (u.Quantity, type(None))):
+            # compare the floats in the units of each limit directly instead
+            # of having astropy convert the units within every comparison
+            if isinstance(value, int) or isinstance(value, float):
+                value_value, value_unit = value, self.default_unit
+            elif isinstance(value, u.Quantity):
+                value_value, value_unit = value.value, value.unit
+            else:
+                value_unit = None
+
+            if value_unit is not None:
+                return (lower is None or value_value * _unit_scale(value_unit, lower.unit) >= lower.value) and (upper is None or value_value * _unit_scale(value_unit, upper.unit) <= upper.value)
+
         if isinstance(value, int) or isinstance(value, float):
             value = value * self.default_unit
 
-        return (self.limits[0] is None or value >= self.limits[0]) and (self.limits[1] is None or value <= self.limits[1])
+        return (lower is None or value >= lower) and (upper is None or value <= upper)
 
     @property
     def timederiv(self):
@@ -9378,7 +9828,7 @@ class FloatParameter(Parameter):
         """
         return self._bundle.filter(context='distribution', qualifier=self.qualifier,
                                    check_visible=False, check_default=False,
-                                   **{k:v for k,v in self.meta.items() if k in _contexts and k not in ['context', 'distribution']}).distributions
+                                   **{k:v for k,v in self.get_meta(ignore=['uniqueid', 'twig', 'uniquetwig']).items() if k in _contexts and k not in ['context', 'distribution']}).distributions
 
     def add_distribution(self, value):
         """
@@ -9436,7 +9886,7 @@ class FloatParameter(Parameter):
                                          distribution=direct_distribution,
                                          context='distribution',
                                          check_visible=False,
-                                         **{k:v for k,v in self.meta.items() if k in _contexts and k not in ['context', 'distribution']})
+                                         **{k:v for k,v in self.get_meta(ignore=['uniqueid', 'twig', 'uniquetwig']).items() if k in _contexts and k not in ['context', 'distribution']})
 
         indirect_params = []
         if follow_constraints and len(self.constrained_by):
@@ -9448,7 +9898,7 @@ class FloatParameter(Parameter):
                                                        distribution=distribution if distribution is not None else constraining_param.in_distributions,
                                                        context='distribution',
                                                        check_visible=False,
-                                                       **{k:v for k,v in constraining_param.meta.items() if k in _contexts and k not in ['context', 'distribution']}).to_list()
+                                                       **{k:v for k,v in constraining_param.get_meta(ignore=['uniqueid', 'twig', 'uniquetwig']).items() if k in _contexts and k not in ['context', 'distribution']}).to_list()
 
         return direct_ps + indirect_params
 
@@ -9536,7 +9986,7 @@ class FloatParameter(Parameter):
                                                      distribution=distribution,
                                                      context='distribution',
                                                      check_visible=False,
-                                                     **{k:v for k,v in self.meta.items() if k in _contexts and k not in ['context', 'distribution']})):
+                                                     **{k:v for k,v in self.get_meta(ignore=['uniqueid', 'twig', 'uniquetwig']).items() if k in _contexts and k not in ['context', 'distribution']})):
 
                 logger.warning("{} is constrained but also has a distribution attached with distribution='{}'.  Returning the distribution propagated through the constraint instead (pass follow_constraints=False to disable this behavior).".format(self.twig, distribution))
 
@@ -9572,7 +10022,7 @@ class FloatParameter(Parameter):
                                                       distribution=distribution,
                                                       context='distribution',
                                                       check_visible=False,
-                                                      **{k:v for k,v in self.meta.items() if k in _contexts and k not in ['context', 'distribution']}).get_value()
+                                                      **{k:v for k,v in self.get_meta(ignore=['uniqueid', 'twig', 'uniquetwig']).items() if k in _contexts and k not in ['context', 'distribution']}).get_value()
                 except ValueError:
                     dist = None
             elif isinstance(distribution, distl._distl.DistributionCollection):
@@ -9661,12 +10111,44 @@ class FloatParameter(Parameter):
         types.  See the documentation of <phoebe.parameters.FloatParameter.get_quantity>
         for full details.
         """
+        cache_key = None
+        if t is None and self.qualifier not in kwargs.keys():
+            value = self._value
+            if isinstance(value, u.Quantity) and value.isscalar:
+                if unit is None:
+                    if value.unit is self.default_unit:
+                        # by far the most common call: a scalar already stored
+                        # in the default units doesn't need to go through
+                        # get_quantity
+                        return value.value
+                else:
+                    # constraints (for example) request the same parameter
+                    # in the same units over and over again, so remember the
+                    # last conversion for as long as the value is unchanged.
+                    # This is keyed on the contents (rather than the identity)
+                    # of the stored quantity, which may be changed in-place.
+                    cache_key = (value.value, value.unit, unit)
+                    cache = self._get_value_cache
+                    if cache is not None and cache[0] == cache_key[0] and cache[1] is cache_key[1] and cache[2] == unit:
+                        return cache[3]
+                    if isinstance(unit, u.UnitBase):
+                        # even if the value has changed, the conversion factor
+                        # between the two units has not
+                        value = value.value * _unit_scale(value.unit, unit)
+                        self._get_value_cache = cache_key + (value,)
+                        return value
+
         quantity = self.get_quantity(unit=unit, t=t,
                                      **kwargs)
         if hasattr(quantity, 'value'):
-            return quantity.value
+            value = quantity.value
         else:
-            return quantity
+            value = quantity
+
+        if cache_key is not None:
+            self._get_value_cache = cache_key + (value,)
+
+        return value
 
     def get_quantity(self, unit=None, t=None,
                      **kwargs):
@@ -9758,6 +10240,10 @@ class FloatParameter(Parameter):
             return value.to(unit)
 
     def _check_value(self, value, unit=None):
+        if value.__class__ is float:
+            # by far the most common case (ie. from solvers), so skip the
+            # checks for all the other accepted input formats below
+            return self._check_type(value), unit
         if isinstance(value, tuple) and (len(value) !=2 or isinstance(value[1], float) or isinstance(value[1], int)):
             # allow passing tuples (this could be a FloatArrayParameter - if it isn't
             # then this array will fail _check_type below)
@@ -9766,17 +10252,23 @@ class FloatParameter(Parameter):
         if isinstance(value, tuple) and unit is None:
             value, unit = value
         if isinstance(value, str):
-            if len(value.strip().split(' ')) == 2 and unit is None and self.__class__.__name__ == 'FloatParameter':
+            valuesplit = value.strip().split(' ')
+            if len(valuesplit) == 2 and unit is None and self.__class__.__name__ == 'FloatParameter':
                 # support value unit as string
-                valuesplit = value.strip().split(' ')
                 value = float(valuesplit[0])
                 unit = valuesplit[1]
 
             elif "," in value and self.__class__.__name__ == 'FloatArrayParameter':
-                try:
-                    value = json.loads(value)
-                    # we'll take it from here in the dict section below
-                except:
+                # a string containing a comma can only be valid JSON if it
+                # is a list, dictionary, or string, otherwise skip straight
+                # to splitting instead of waiting for json to fail
+                if value.lstrip()[:1] in ('[', '{', '"'):
+                    try:
+                        value = json.loads(value)
+                        # we'll take it from here in the dict section below
+                    except:
+                        value = np.asarray([float(v) for v in value.split(',') if len(v)])
+                else:
                     value = np.asarray([float(v) for v in value.split(',') if len(v)])
 
             else:
@@ -9874,9 +10366,14 @@ class FloatParameter(Parameter):
         """
         self._readonly_check(**kwargs)
 
-        _orig_quantity = _deepcopy(self.get_quantity())
+        # get_quantity already returns a copy, and the original is only needed
+        # to skip re-running constraints for (scalar) FloatParameters, so don't
+        # bother if this parameter isn't in any constraints
+        _orig_quantity = self.get_quantity() if self.__class__.__name__ == 'FloatParameter' and len(self._in_constraints) else None
 
-        if len(self.constrained_by) and not force:
+        # constraints set their results with force=True, so check that first
+        # to avoid looking up the constraining parameters
+        if not force and len(self.constrained_by):
             raise ValueError("cannot change the value of a constrained parameter.  This parameter is constrained by '{}'".format(', '.join([p.uniquetwig for p in self.constrained_by])))
 
         # if 'time' in kwargs.keys() and isinstance(self, FloatArrayParameter):
@@ -9908,7 +10405,7 @@ class FloatParameter(Parameter):
             value = value * self.default_unit
 
         # handle wrapping for angle measurements
-        if value is not None and value.unit.physical_type == 'angle':
+        if value is not None and _is_angle_unit(value.unit):
             # NOTE: this may fail for nparray types
             if value > (360*u.deg) or value < (0*u.deg):
                 if self._bundle is not None and self._bundle._within_solver and not kwargs.get('from_constraint', False):
@@ -9924,31 +10421,38 @@ class FloatParameter(Parameter):
             raise ValueError("value of {}={} not within limits of {}".format(self.qualifier, value, self.limits))
 
 
-        # make sure we can convert back to the default_unit
+        # make sure we can convert back to the default_unit (only the units
+        # need to be checked, there is no need to convert the value itself)
         try:
             if self.default_unit is not None and value is not None:
-                test = value.to(self.default_unit)
+                test = value.unit.to(self.default_unit)
         except u.core.UnitsError:
             raise ValueError("cannot convert provided unit ({}) to default unit ({})".format(value.unit, self.default_unit))
         except:
             self._value = value
         else:
             self._value = value
+        self._get_value_cache = None
 
         if run_constraints is None:
             run_constraints = conf.interactive_constraints
 
+        # NOTE: in_constraints needs to look up each constraint in the bundle,
+        # so only build the debug messages if they will actually be logged
+        log_debug = logger.isEnabledFor(logging.DEBUG)
+
         if _orig_quantity is not None and self.__class__.__name__ == 'FloatParameter' and abs(_orig_quantity - value).value < 1e-12:
-            logger.debug("value of {} didn't change within 1e-12, skipping triggering of constraints".format(self.twig))
+            if log_debug:
+                logger.debug("value of {} didn't change within 1e-12, skipping triggering of constraints".format(self.twig))
         elif run_constraints:
-            if len(self._in_constraints):
+            if len(self._in_constraints) and log_debug:
                 logger.debug("changing value of {} triggers {} constraints".format(self.twig, [c.twig for c in self.in_constraints]))
             for constraint_id in self._in_constraints:
                 self._bundle.run_constraint(uniqueid=constraint_id, skip_kwargs_checks=True, run_constraints=run_constraints)
         else:
             # then we want to delay running constraints... so we need to track
             # which ones need to be run once requested
-            if len(self._in_constraints):
+            if len(self._in_constraints) and log_debug:
                 logger.debug("changing value of {} triggers delayed constraints {}".format(self.twig, [c.twig for c in self.in_constraints]))
             for constraint_id in self._in_constraints:
                 if constraint_id not in self._bundle._delayed_constraints:
@@ -9985,7 +10489,7 @@ class FloatArrayParameter(FloatParameter):
         # NOTE: default_unit and value handled in FloatParameter.__init__()
 
         self._dict_fields_other = ['description', 'value', 'default_unit', 'visible_if', 'required_shape', 'copy_for', 'readonly', 'advanced', 'latexfmt']
-        self._dict_fields = _meta_fields_all + self._dict_fields_other
+        self._dict_fields_other, self._dict_fields = _intern_dict_fields(self._dict_fields_other)
 
     def __repr__(self):
         """
@@ -10027,9 +10531,10 @@ class FloatArrayParameter(FloatParameter):
         --------
         * (str)
         """
+        uniquetwig = self.uniquetwig
         opt = np.get_printoptions()
-        np.set_printoptions(threshold=8, edgeitems=3, linewidth=opt['linewidth']-len(self.uniquetwig)-2)
-        str_ = super(FloatArrayParameter, self).to_string_short()
+        np.set_printoptions(threshold=8, edgeitems=3, linewidth=opt['linewidth']-len(uniquetwig)-2)
+        str_ = self._to_string_short(uniquetwig)
         np.set_printoptions(**opt)
         return str_
 
@@ -10409,7 +10914,7 @@ class ArrayParameter(Parameter):
         self.set_value(kwargs.get('value', []), ignore_readonly=True)
 
         self._dict_fields_other = ['description', 'value', 'visible_if', 'copy_for', 'readonly', 'advanced', 'latexfmt']
-        self._dict_fields = _meta_fields_all + self._dict_fields_other
+        self._dict_fields_other, self._dict_fields = _intern_dict_fields(self._dict_fields_other)
 
     def append(self, value):
         """
@@ -10478,7 +10983,6 @@ class ArrayParameter(Parameter):
         """
         self._readonly_check(**kwargs)
 
-        _orig_value = _deepcopy(self._value)
         if self.qualifier in ['mask_phases', 'fitted_values', 'initial_values']:
             # avoid the ragged sequence deprecation warning
             self._value = np.asarray(value, dtype=object)
@@ -10537,8 +11041,6 @@ class HierarchyParameter(StringParameter):
 
         # TODO: check to make sure valid
 
-        _orig_value = _deepcopy(self.get_value())
-
         try:
             value = str(value)
         except:
@@ -10665,7 +11167,7 @@ class HierarchyParameter(StringParameter):
         -------
         * (list of strings)
         """
-        l = re.findall(r"[\w']+", self.get_value())
+        l = _twig_words_re.findall(self.get_value())
         return l[1::2]
 
     def get_top(self):
@@ -10707,7 +11209,7 @@ class HierarchyParameter(StringParameter):
         -------
         * (list of strings)
         """
-        l = re.findall(r"[\w']+", self.get_value())
+        l = _twig_words_re.findall(self.get_value())
         # now search for indices of star and take the next entry from this flat list
         return [l[i+1] for i,s in enumerate(l) if s=='star']
 
@@ -10730,7 +11232,7 @@ class HierarchyParameter(StringParameter):
         -------
         * (list of strings)
         """
-        l = re.findall(r"[\w']+", self.get_value())
+        l = _twig_words_re.findall(self.get_value())
         # now search for indices of star and take the next entry from this flat list
         return [l[i+1] for i,s in enumerate(l) if s=='envelope']
 
@@ -10764,7 +11266,7 @@ class HierarchyParameter(StringParameter):
         return orbits
 
     def _compute_meshables(self):
-        l = re.findall(r"[\w']+", self.get_value())
+        l = _twig_words_re.findall(self.get_value())
         # now search for indices of star and take the next entry from this flat list
         meshables = [l[i+1] for i,s in enumerate(l) if s in ['star', 'envelope']]
 
@@ -11375,13 +11877,16 @@ class ConstraintParameter(Parameter):
         self._vars = self._addl_vars
         self._var_params = None
         self._addl_var_params = None
+        # (expression and input values, result) of the last evaluation of a
+        # built-in constraint function, see get_result
+        self._result_cache = None
         self._constraint_func = kwargs.get('constraint_func', None)
         self._constraint_kwargs = kwargs.get('constraint_kwargs', {})
         self._in_solar_units = kwargs.get('in_solar_units', False)
         self.set_value(value, ignore_readonly=True)
         self.set_default_unit(default_unit)
         self._dict_fields_other = ['description', 'value', 'default_unit', 'constraint_func', 'constraint_kwargs', 'constraint_addl_vars', 'in_solar_units', 'readonly', 'advanced', 'latexfmt']
-        self._dict_fields = _meta_fields_all + self._dict_fields_other
+        self._dict_fields_other, self._dict_fields = _intern_dict_fields(self._dict_fields_other)
 
     @property
     def is_visible(self):
@@ -11484,7 +11989,7 @@ class ConstraintParameter(Parameter):
         # but always display the /current/ uniquetwig in the expression
 
         vars_ = []
-        lbls = re.findall(r'\{.[^{}]*\}', expr)
+        lbls = _constraint_var_re.findall(expr)
 
         for lbl in lbls:
             twig = lbl.replace('{', '').replace('}', '')
@@ -11549,7 +12054,29 @@ class ConstraintParameter(Parameter):
         -------
         * (<phoebe.parameters.Parameter>)
         """
-        return self.get_parameter(qualifier=self.qualifier, component=self.component, dataset=self.dataset, check_visible=False)
+        tags = {'qualifier': self.qualifier, 'component': self.component,
+                'dataset': self.dataset, 'feature': self.feature}
+        if tags['qualifier'] is None:
+            # not (yet) attached to solve for anything
+            return self.get_parameter(check_visible=False, **tags)
+
+        # this is called for every constraint whenever filtering checks
+        # visibility, so match the vars directly rather than building and
+        # filtering the combined ParameterSet of all vars
+        tags = [(tag, value) for tag, value in tags.items() if value is not None]
+        match = None
+        for param in self.vars.to_list() + self.addl_vars.to_list():
+            if param.context == 'constraint' or not all(getattr(param, tag) == value for tag, value in tags):
+                continue
+            if match is None:
+                match = param
+            elif param.uniqueid != match.uniqueid:
+                raise ValueError("more than one parameter constrained by {} found: {}".format(self.twig, [match.twig, param.twig]))
+
+        if match is None:
+            # falls back on filtering the bundle
+            return self.get_parameter(check_visible=False, **dict(tags))
+        return match
 
     def get_parameter(self, twig=None, **kwargs):
         """
@@ -11624,7 +12151,9 @@ class ConstraintParameter(Parameter):
         -----------
         * (list)
         """
-        return self.default_unit.find_equivalent_units()
+        equivalent_units = _equivalent_units(self.default_unit)
+        # return a copy so the cached list can't be modified by the caller
+        return equivalent_units.__class__(equivalent_units)
 
     @property
     def default_unit(self):
@@ -11684,7 +12213,7 @@ class ConstraintParameter(Parameter):
         if not _is_unit(unit):
             raise TypeError("unit must be a Unit")
 
-        if hasattr(self, '_default_unit') and self._default_unit is not None:
+        if getattr(self, '_default_unit', None) is not None and unit != self._default_unit:
             # we won't use a try except here so that the error comes from astropy
             check_convert = self._default_unit.to(unit)
 
@@ -11708,8 +12237,6 @@ class ConstraintParameter(Parameter):
         """
         self._readonly_check(**kwargs)
 
-        _orig_value = _deepcopy(self.get_value())
-
         if self._bundle is None:
             raise ValueError("ConstraintParameters must be attached from the bundle, and cannot be standalone")
         value = str(value)
@@ -11746,6 +12273,9 @@ class ConstraintParameter(Parameter):
 
     def _remove_bookkeeping(self):
         # logger.debug("ConstraintParameter {} _remove_bookkepping".format(self.twig))
+        # NOTE: ParameterSet.__add__ returns a new ParameterSet, so this does
+        # not extend the cached self.vars with the addl_vars (which would then
+        # be registered as constraining parameters by _update_bookkeeping)
         vars = self.vars + self.addl_vars
         for param in vars.to_list():
             if hasattr(param, '_is_constraint') and param._is_constraint == self.uniqueid:
@@ -11781,10 +12311,16 @@ class ConstraintParameter(Parameter):
         if expr is not None:
             vars = self._vars + self._addl_vars
             for var in vars:
+                safe_label = str(var.safe_label)
+                if safe_label not in expr:
+                    # updating the user_label requires determining the
+                    # uniquetwig (filtering the entire bundle several
+                    # times), so skip any vars not in the expression
+                    continue
                 # update to current unique twig
                 var.update_user_label()  # update curly label
                 #~ print "***", expr, var.safe_label, var.curly_label
-                expr = expr.replace(str(var.safe_label), str(var.curly_label))
+                expr = expr.replace(safe_label, str(var.curly_label))
 
         return expr
 
@@ -11917,38 +12453,32 @@ class ConstraintParameter(Parameter):
         * (quantity): the current result of evaluating the constraint expression.
         """
         # TODO: optimize this:
-        # almost half the time is being spent on self.get_value() of which most is spent on var.update_user_label
-        # second culprit is converting everything to si
-        # third culprit is the dictionary comprehensions
-
-        # in theory, it would be nice to prepare this list at the module import
-        # level, but that causes an infinite loop in the imports, so we'll
-        # do a re-import here.  If this causes significant lag, it may be worth
-        # trying to resolve the infinite loop.
-        from phoebe.constraints import builtin
-        _constraint_builtin_funcs = [f for f in dir(builtin) if isinstance(getattr(builtin, f), types.FunctionType)]
-        _constraint_math_funcs = ['sin', 'cos', 'tan', 'arcsin', 'arccos', 'arctan', 'arctan2', 'sqrt', 'log10']
-
-        def eq_needs_builtin(eq, include_math=True):
-            builtin_funcs =  _constraint_builtin_funcs + _constraint_math_funcs if include_math else _constraint_builtin_funcs
-            for func in builtin_funcs:
-                if "{}(".format(func) in eq:
-                    #print "*** eq_needs_builtin", func
-                    return True
-            return False
+        # converting everything to si and the dictionary comprehensions.
+        # self.get_value() (which updates the user_labels of all vars) is only
+        # called when the user_labels are actually needed.
+
+        eq_needs_builtin = _constraint_expr_needs_builtin
+        # the constrained parameter is compared against every var below
+        # so only filter for it once
+        constrained_parameter = self.constrained_parameter
 
-        def get_values(vars, safe_label=True, string_safe_arrays=False, use_distribution=None, needs_builtin=False):
+        def get_values(vars, safe_label=True, string_safe_arrays=False, use_distribution=None, needs_builtin=False, python_types=False):
             # use np.float64 so that dividing by zero will result in a
             # np.inf
-            def _single_value(quantity, string_safe_arrays=False):
+            def _single_value(quantity, string_safe_arrays=False, python_types=False):
                 if isinstance(quantity, u.Quantity):
                     if self.in_solar_units:
-                        v = np.float64(u.to_solar(quantity).value)
+                        v = np.float64(quantity.value * _solar_scale(quantity.unit))
                     else:
-                        v = np.float64(quantity.si.value)
-
-                    if isinstance(v, np.ndarray) and string_safe_arrays:
-                        v = v.tolist()
+                        v = np.float64(quantity.value * _si_scale(quantity.unit))
+
+                    if isinstance(v, np.ndarray):
+                        if string_safe_arrays:
+                            v = v.tolist()
+                        # otherwise arrays are passed as arrays (the built-in
+                        # functions convert lists back to arrays anyways)
+                    elif python_types:
+                        v = float(v)
                     return v
                 elif isinstance(quantity, distl.BaseDistlObject):
                     if self.in_solar_units:
@@ -11956,15 +12486,15 @@ class ConstraintParameter(Parameter):
                     else:
                         v = quantity.to_si(strip_units=True)
                     return v
-                elif isinstance(quantity, str):
+                elif isinstance(quantity, str) and not python_types:
                     return '\'{}\''.format(quantity)
                 else:
                     return quantity
 
-            def _value(var, string_safe_arrays=False, use_distribution=None, needs_builtin=False):
+            def _value(var, string_safe_arrays=False, use_distribution=None, needs_builtin=False, python_types=False):
                 param = var.get_parameter()
 
-                if use_distribution and param != self.constrained_parameter:
+                if use_distribution and param != constrained_parameter:
                     # print("\n\n*** {}.get_result param={}".format(self.twig, param.twig))
                     dist = param.get_distribution(use_distribution, distribution_uniqueids=distribution_uniqueids, follow_constraints=True)
 
@@ -11976,14 +12506,17 @@ class ConstraintParameter(Parameter):
                             # will we need to force distribution_uniqueids to be included in the json?
                             return "distl_from_json('{}')".format(_single_value(dist).to_json(export_func_as_path=True, exclude=['label_latex', 'labels_latex']))
 
-                if param != self.constrained_parameter:
-                    return _single_value(var.get_quantity(t=t), string_safe_arrays)
+                if param != constrained_parameter:
+                    return _single_value(var.get_quantity(t=t), string_safe_arrays, python_types)
                 else:
-                    return _single_value(var.get_quantity(), string_safe_arrays)
+                    return _single_value(var.get_quantity(), string_safe_arrays, python_types)
 
-            return {var.safe_label if safe_label else var.user_label: _value(var, string_safe_arrays, use_distribution, needs_builtin) for var in vars}
+            return {var.safe_label if safe_label else var.user_label: _value(var, string_safe_arrays, use_distribution, needs_builtin, python_types) for var in vars}
 
-        eq = self.get_value()
+        # the builtin functions appear identically in self._value (which
+        # refers to vars by their safe_label), so whether they're needed can
+        # be determined without updating the user_labels
+        eq = self._value
 
         if _use_sympy and not eq_needs_builtin(eq) and not use_distribution:
             values = get_values(self._vars+self._addl_vars, safe_label=True)
@@ -12006,26 +12539,45 @@ class ConstraintParameter(Parameter):
             #     print("***", values)
             #     return
             needs_builtin_or_math = eq_needs_builtin(eq)
-            if needs_builtin_or_math or use_distribution:
+            needs_builtin = needs_builtin_or_math and eq_needs_builtin(eq, include_math=False)
+            cache_key = None
+            if needs_builtin or use_distribution:
                 # the else (which works for np arrays) does not work for the built-in funcs
                 # this means that we can't currently support the built-in funcs WITH arrays
-                needs_builtin = eq_needs_builtin(eq, include_math=False)
-
-                # cannot do from builtin import *
-                for func in _constraint_builtin_funcs + _constraint_math_funcs:
-                    # I should be shot for doing this...
-                    # in order for eval to work, the builtin functions need
-                    # to be imported at the top-level, but I don't really want
-                    # to do from builtin import * (and even if I did, python
-                    # yells at me for doing that), so instead we'll add them
-                    # to the locals dictionary.
-                    locals()[func] = getattr(builtin, func)
+
+                # cannot do from builtin import *, so instead the builtin
+                # (and math) functions are passed to eval as its locals
+                # (this namespace is only built once)
+                eval_funcs = _get_constraint_eval_funcs()
 
                 # if eq.split('(')[0] in ['times_to_phases', 'phases_to_times']:
                     # these require passing the bundle
                     # values['b'] = self._bundle
 
-                values = get_values([v for v in self._vars+self._addl_vars if v.user_label in eq], safe_label=False, string_safe_arrays=True, use_distribution=use_distribution, needs_builtin=needs_builtin)
+                if use_distribution:
+                    # self.get_value() will update the user_labels to be the
+                    # current unique twigs (which are used as keys in values below)
+                    eq = self.get_value()
+                    values = get_values([v for v in self._vars+self._addl_vars if v.user_label in eq], safe_label=False, string_safe_arrays=True, use_distribution=use_distribution, needs_builtin=needs_builtin)
+                else:
+                    # the compiled expression refers to the vars by their
+                    # safe_labels, so there is no need to update the
+                    # user_labels or to format the values into the string (and
+                    # then parse it again on every call).  The values are
+                    # passed as the python types that parsing would have given.
+                    expr_names = _constraint_expr_names(self._value)
+                    values = get_values([v for v in self._vars+self._addl_vars if v.safe_label in expr_names], safe_label=True, python_types=True)
+
+                    # the built-in functions (roche potentials, etc) can be
+                    # expensive but are deterministic, so if neither the
+                    # expression nor any of the input values have changed
+                    # since the last call, the previous result can be reused.
+                    # Array inputs are unhashable and are never cached.
+                    cache_key = (self._value, tuple(values.items()))
+                    try:
+                        hash(cache_key)
+                    except TypeError:
+                        cache_key = None
 
                 if needs_builtin and use_distribution:
                     # need to parse {} in eq and get values in correct order as args (including non {}, like 1)
@@ -12045,12 +12597,16 @@ class ConstraintParameter(Parameter):
                         # these are particularly expensive, so we'll only use 1000 samples in the underlying histogram by default
                         hist_samples = 1000
                         vectorized = False
-                    if funcname[:2] == 't0':
+                    if funcname.startswith('t0'):
                         vectorized = True
-                    value = distl.function(locals().get(funcname), args, vectorized=vectorized, hist_samples=hist_samples)
-                else:
+                    value = distl.function(eval_funcs.get(funcname), args, vectorized=vectorized, hist_samples=hist_samples)
+                elif use_distribution:
                     # print("\n\n\n*** eval eq={} values={}".format(eq, values))
-                    value = eval(eq.format(**values))
+                    value = eval(eq.format(**values), globals(), eval_funcs)
+                elif cache_key is not None and self._result_cache is not None and self._result_cache[0] == cache_key:
+                    value = self._result_cache[1]
+                else:
+                    value = eval(_compile_constraint_expr(self._value), _get_constraint_eval_globals(), values)
 
                 if value is None:
                     if suppress_error:
@@ -12062,6 +12618,8 @@ class ConstraintParameter(Parameter):
                     if use_distribution is None:
                         try:
                             value = float(value)
+                            if cache_key is not None:
+                                self._result_cache = (cache_key, value)
                         except TypeError as err:
                             try:
                                 value = np.asarray(value)
@@ -12087,8 +12645,25 @@ class ConstraintParameter(Parameter):
                 # vars = [ConstraintVar(self._bundle, twig) for twig in self._bundle.filter(context=['component', 'system', 'dataset']).twigs]
                 # values = get_values(vars, safe_label=True)
 
-                values = get_values(self._vars+self._addl_vars, safe_label=True)
-
+                expr_names = _constraint_expr_names(self._value)
+                expr_vars = [v for v in self._vars+self._addl_vars if v.safe_label in expr_names]
+                # constraints using the math functions used to be evaluated by
+                # formatting the values into the expression, so keep passing
+                # them as python floats (dividing by zero raises rather than
+                # giving np.inf) and do not accept non-finite values
+                values = get_values(expr_vars, safe_label=True, python_types=needs_builtin_or_math)
+
+                if needs_builtin_or_math:
+                    for var in expr_vars:
+                        var_value = values[var.safe_label]
+                        if isinstance(var_value, float) and not np.isfinite(var_value):
+                            raise ValueError("{} constraint cannot be evaluated with {}={}".format(self.twig, var.get_parameter().twig, var_value))
+
+                    # the math functions (unlike the other built-in funcs)
+                    # work on np arrays, so can be evaluated here without
+                    # needing the user_labels
+                    eval_funcs = _get_constraint_eval_funcs()
+                    values.update({func: eval_funcs[func] for func in _constraint_math_funcs})
 
                 # if any of the arrays are empty (except the one we're filling)
                 # then we want to return an empty array as well (the math would fail)
@@ -12097,7 +12672,7 @@ class ConstraintParameter(Parameter):
                     var_value = var.get_value()
                     #print "***", self.twig, self.constrained_parameter.twig, var.user_label, var_value, isinstance(var_value, np.ndarray), var.unique_label != self.constrained_parameter.uniqueid
                     # if self.qualifier is None then this isn't attached to solve anything yet, so we don't need to worry about checking to see if the var is the constrained parameter
-                    if isinstance(var_value, np.ndarray) and len(var_value)==0 and (var.unique_label != self.constrained_parameter.uniqueid or self.qualifier is None):
+                    if isinstance(var_value, np.ndarray) and len(var_value)==0 and (var.unique_label != constrained_parameter.uniqueid or self.qualifier is None):
                         #print "*** found empty array", self.constrainted_parameter.twig, var.safe_label, var_value
                         arrays_filled = False
                         #break  # out of the for loop
@@ -12105,7 +12680,7 @@ class ConstraintParameter(Parameter):
                 if arrays_filled:
                     #print "*** else else", self._value, values
                     #print "***", _use_sympy, self._value, value
-                    value = eval(self._value, values)
+                    value = eval(_compile_constraint_expr(self._value), values)
                 else:
                     #print "*** EMPTY ARRAY FROM CONSTRAINT"
                     value = np.array([])
@@ -12126,9 +12701,9 @@ class ConstraintParameter(Parameter):
                 value = value.to(self.default_unit)
             else:
                 if self.in_solar_units:
-                    convert_scale = u.to_solar(self.default_unit)
+                    convert_scale = _solar_scale(self.default_unit)
                 else:
-                    convert_scale = self.default_unit.to_system(u.si)[0].scale
+                    convert_scale = _si_system_scale(self.default_unit)
                 #value = float(value/convert_scale) * self.default_unit
                 value = value/convert_scale * self.default_unit
 
@@ -12212,6 +12787,7 @@ class ConstraintParameter(Parameter):
             raise ValueError("must either have sympy installed or provide a new expression")
 
         self._qualifier = newly_constrained_param.qualifier
+        _tags_changed()
         self._component = newly_constrained_param.component
         self._kind = newly_constrained_param.kind
 
@@ -12278,7 +12854,7 @@ class JobParameter(Parameter):
         # TODO: add a description?
 
         self._dict_fields_other = ['description', 'value', 'job_name', 'uniqueid', 'readonly', 'advanced', 'latexfmt']
-        self._dict_fields = _meta_fields_all + self._dict_fields_other
+        self._dict_fields_other, self._dict_fields = _intern_dict_fields(self._dict_fields_other)
 
     def __str__(self):
         """
@@ -141,16 +141,12 @@ def _lnprobability(sampled_values, b, params_uniqueids, compute,
     # face-values
     b._within_solver = True
     if sampled_values is not False:
-        for uniqueid, value in zip(params_uniqueids, sampled_values):
-            uniqueid, index = _extract_index_from_string(uniqueid)
-            try:
-                if index is not None:
-                    b.get_parameter(uniqueid=uniqueid, **_skip_filter_checks).set_index_value(index=index, value=value, run_checks=False, run_constraints=False)
-                else:
-                    b.set_value(uniqueid=uniqueid, value=value, run_checks=False, run_constraints=False, **_skip_filter_checks)
-            except ValueError as err:
-                logger.warning("received error while setting values: {}. lnprobability=-inf".format(err))
-                return _return(-np.inf, str(err))
+        try:
+            # set all sampled values in a single pass over the bundle
+            b._set_values_by_uniqueid(params_uniqueids, sampled_values, run_checks=False, run_constraints=False)
+        except ValueError as err:
+            logger.warning("received error while setting values: {}. lnprobability=-inf".format(err))
+            return _return(-np.inf, str(err))
 
     # run delayed constraints and failed constraints would be run within calculate_lnp or run_compute,
     # but here we can catch the error in advance and return it appropriately
@@ -1564,7 +1560,8 @@ class EmceeBackend(BaseSolverBackend):
                 wrap_central_values = continue_from_ps.get_value(qualifier='wrap_central_values', **_skip_filter_checks)
                 params_uniqueids = continue_from_ps.get_value(qualifier='fitted_uniqueids', **_skip_filter_checks)
 
-                if not np.all([uniqueid.split('[')[0] in b.uniqueids for uniqueid in params_uniqueids]):
+                b_uniqueids = set(b.uniqueids)
+                if not np.all([uniqueid.split('[')[0] in b_uniqueids for uniqueid in params_uniqueids]):
                     logger.info("continue_from uniqueid matches not found, falling back on twigs")
                     params_twigs = continue_from_ps.get_value(qualifier='fitted_twigs', **_skip_filter_checks)
                     original_params_uniqueids = list(params_uniqueids)
@@ -1582,7 +1579,7 @@ class EmceeBackend(BaseSolverBackend):
                     params_twigs = [_to_twig_with_index(b.get_parameter(uniqueid=uniqueid, **_skip_filter_checks).twig, index) for uniqueid, index in params_uniqueids_and_indices]
 
 
-                if not np.all([uniqueid in b.uniqueids for uniqueid in wrap_central_values.keys()]):
+                if not np.all([uniqueid in b_uniqueids for uniqueid in wrap_central_values.keys()]):
                     # this really shouldn't happen... but if the bundle was
                     # re-created, then we probably don't even have the original
                     # distributions.... so we're forced using the samples from the solution
@@ -2438,15 +2435,17 @@ class Differential_CorrectionsBackend(BaseSolverBackend):
             # for loop isn't ideal here, but we shouldn't be looping over too many datasets
             # to optimize this, we would need to ensure that calculate_residuals returns
             # the concatenated lists in a predictable and reliable order
-            xi = np.array([])
-            obs_baseline = np.array([])
+            # collect the per-dataset arrays and concatenate once at the end
+            # rather than re-allocating on every np.append
+            xis = [np.array([])]
+            obs_baselines = [np.array([])]
             for p in obs_params:
                 if p.component == '_default':
                     continue
                 resid, interp_model = b_solver.calculate_residuals(model=model, dataset=p.dataset, component=p.component, return_interp_model=True, as_quantity=False)
-                xi = np.append(xi, resid)
-                obs_baseline = np.append(obs_baseline, interp_model)
-            return xi, obs_baseline
+                xis.append(resid)
+                obs_baselines.append(interp_model)
+            return np.concatenate(xis), np.concatenate(obs_baselines)
 
         baseline_model = b_solver.run_compute(model='baseline', overwrite=True)
         xi, obs_baseline = _get_residuals_and_interp_model(b_solver, 'baseline', obs_params)
@@ -2,6 +2,7 @@
 """
 
 import phoebe
+import numpy as np
 import pytest
 
 
@@ -89,8 +90,143 @@ def test_pot_filloutfactor(verbose=False):
     assert b.run_checks().passed
 
 
+def test_delayed_constraints(verbose=False):
+    if verbose:
+        print("b = phoebe.default_binary()")
+    b = phoebe.default_binary()
+    b.flip_constraint('mass@primary', solve_for='q')
+
+    b_delayed = b.copy()
+
+    for b_i, interactive in zip([b, b_delayed], [True, False]):
+        if not interactive:
+            phoebe.interactive_constraints_off()
+
+        try:
+            b_i.set_value('period@binary', 2.0)
+            b_i.set_value('sma@binary', 6.0)
+            b_i.set_value('mass@primary@component', 0.3)
+            b_i.set_value('requiv@primary', 1.1)
+
+            if not interactive:
+                b_i.run_delayed_constraints()
+        finally:
+            # never leave constraints delayed for any later tests
+            phoebe.interactive_constraints_on()
+
+    assert not len(b_delayed._delayed_constraints)
+
+    for qualifier in ['q', 'mass@secondary', 'sma@primary', 'asini@secondary', 'requiv_max@primary', 'logg@primary']:
+        if verbose:
+            print("{}: {} {}".format(qualifier, b.get_value(qualifier, context='component'), b_delayed.get_value(qualifier, context='component')))
+        assert abs(b.get_value(qualifier, context='component') - b_delayed.get_value(qualifier, context='component')) < 1e-8
+
+
+def test_delayed_constraints_cycle(verbose=False):
+    if verbose:
+        print("b = phoebe.default_binary()")
+    b = phoebe.default_binary()
+
+    phoebe.interactive_constraints_off()
+    try:
+        # two constraints that depend on each other and can never converge
+        teff1 = b.get_parameter(qualifier='teff', component='primary', context='component')
+        teff2 = b.get_parameter(qualifier='teff', component='secondary', context='component')
+        b.add_constraint(teff1, teff2 + 100)
+        b.add_constraint(teff2, teff1 + 100)
+
+        with pytest.raises(ValueError):
+            b.run_delayed_constraints()
+    finally:
+        # never leave constraints delayed for any later tests
+        phoebe.interactive_constraints_on()
+
+
+def test_math_constraint_errors(verbose=False):
+    if verbose:
+        print("b = phoebe.default_binary()")
+    b = phoebe.default_binary()
+
+    # asini@primary divides by (1/q), and uses sin, so should raise rather
+    # than silently dividing by zero
+    b.set_value(qualifier='q', component='binary', context='component', value=0.0)
+    asini = b.get_parameter(qualifier='asini', component='primary', context='constraint')
+    with pytest.raises(ZeroDivisionError):
+        asini.get_result(suppress_error=False)
+
+    # and should not accept non-finite values for any of its variables
+    b.set_value(qualifier='q', component='binary', context='component', value=1.0)
+    b.get_parameter(qualifier='sma', component='binary', context='component').set_value(np.inf, run_constraints=False)
+    with pytest.raises(ValueError):
+        asini.get_result(suppress_error=False)
+
+
+def test_feature_constraint(verbose=False):
+    if verbose:
+        print("b = phoebe.default_binary()")
+    b = phoebe.default_binary()
+    b.add_feature('spot', component='primary', feature='spot01')
+    b.add_feature('spot', component='primary', feature='spot02')
+
+    # both radii share the qualifier and component, so the constrained
+    # parameter can only be told apart by the feature
+    b.add_constraint(b.get_parameter(qualifier='radius', feature='spot01', context='feature'),
+                     b.get_parameter(qualifier='radius', feature='spot02', context='feature') * 2)
+    constraint = b.get_parameter(qualifier='radius', feature='spot01', context='constraint')
+    if verbose:
+        print("constrained_parameter: {}".format(constraint.constrained_parameter.twig))
+    assert constraint.constrained_parameter.feature == 'spot01'
+
+    b.set_value(qualifier='radius', feature='spot02', context='feature', value=5)
+    assert b.get_value(qualifier='radius', feature='spot01', context='feature') == 10
+    assert b.get_value(qualifier='radius', feature='spot02', context='feature') == 5
+
+
+def test_in_constraints(verbose=False):
+    if verbose:
+        print("b = phoebe.default_binary()")
+    b = phoebe.default_binary()
+
+    # sma@binary is only an additional (flip) variable of the requivratio
+    # constraint, so it should not be listed as constraining requivratio
+    sma = b.get_parameter(qualifier='sma', component='binary', context='component')
+    if verbose:
+        print("sma.constrains: {}".format([p.twig for p in sma.constrains]))
+    assert 'requivratio' not in [p.qualifier for p in sma.constrains]
+    assert 'requivratio' not in [p.qualifier for p in sma.in_constraints]
+    assert 'asini' in [p.qualifier for p in sma.constrains]
+
+    requiv = b.get_parameter(qualifier='requiv', component='primary', context='component')
+    assert 'requivratio' in [p.qualifier for p in requiv.constrains]
+    assert 'requivratio' in [p.qualifier for p in requiv.in_constraints]
+
+
+def test_filter_after_flip(verbose=False):
+    if verbose:
+        print("b = phoebe.default_binary()")
+    b = phoebe.default_binary()
+
+    # filter (and so index) a sub-ParameterSet before the flip changes the
+    # qualifier of the constraint in-place
+    ps = b.filter(context='constraint')
+    assert not len(ps.filter(qualifier='q'))
+
+    b.flip_constraint('mass@primary', solve_for='q')
+
+    if verbose:
+        print("ps.filter(qualifier='q'): {}".format(ps.filter(qualifier='q').twigs))
+    assert ps.filter(qualifier='q').twigs == ['q@binary@orbit@constraint']
+    assert not len(ps.filter(qualifier='mass', component='primary'))
+
+
 if __name__ == '__main__':
     logger = phoebe.logger(clevel='WARNING')
 
     test_esinw_ecosw(verbose=True)
     test_pot_filloutfactor(verbose=True)
+    test_delayed_constraints(verbose=True)
+    test_delayed_constraints_cycle(verbose=True)
+    test_math_constraint_errors(verbose=True)
+    test_feature_constraint(verbose=True)
+    test_in_constraints(verbose=True)
+    test_filter_after_flip(verbose=True)
@@ -0,0 +1,25 @@
+import phoebe
+from phoebe import u
+
+
+def test_get_value_unit():
+    b = phoebe.default_binary()
+    p = b.get_parameter(qualifier='teff', component='primary', context='component')
+
+    q = 6000*u.K
+    p.set_value(q)
+    assert abs(p.get_value(unit=u.mK) - 6e6) < 1e-6
+
+    # changing the stored quantity in-place must not return a stale
+    # (previously converted) value
+    q *= 2
+    assert abs(p.get_value() - 12000) < 1e-9
+    assert abs(p.get_value(unit=u.mK) - 1.2e7) < 1e-6
+
+    p.set_value(5000*u.K)
+    assert abs(p.get_value(unit=u.mK) - 5e6) < 1e-6
+
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='debug')
+    test_get_value_unit()
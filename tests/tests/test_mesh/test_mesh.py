@@ -120,6 +120,31 @@ def test_binary(plot=False, gen_comp=False):
     phoebe.devel_off()  # reset for future tests
 
 
+def test_weighted_averages():
+    """
+    """
+    from phoebe.backend import mesh
+
+    vertices = np.array([[0., 0., 0.], [1., 0., 0.], [0., 1., 0.], [1., 1., 0.]])
+    triangles = np.array([[0, 1, 2], [1, 3, 2]])
+    # non-uniform (partially visible) weights per vertex of each triangle
+    weights = np.array([[0.5, 0.3, 0.2], [0.1, 0.1, 0.8]])
+    velocities = np.array([[1., 2., 3.], [4., 5., 6.], [7., 8., 9.], [10., 11., 12.]])
+
+    m = mesh.Mesh(compute_at_vertices=True, vertices=vertices,
+                  triangles=triangles, weights=weights,
+                  velocities=velocities, teffs=velocities[:,0])
+
+    # vector column: each (x,y,z) component is averaged over the 3 vertices
+    expected = np.array([np.dot(w, velocities[t]) for w, t in zip(weights, triangles)])
+    assert m.velocities.weighted_averages.shape == (2, 3)
+    assert np.allclose(m.velocities.weighted_averages, expected)
+
+    # scalar column
+    assert np.allclose(m.teffs.weighted_averages, expected[:,0])
+
+
 if __name__ == '__main__':
     logger = phoebe.logger('debug')
     test_binary(plot=True, gen_comp=True)
+    test_weighted_averages()
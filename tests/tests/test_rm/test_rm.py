@@ -1,7 +1,11 @@
 import phoebe
 import numpy as np
 import os
-import matplotlib.pyplot as plt
+try:
+    import matplotlib.pyplot as plt
+    PLOTTING_ENABLED = True
+except ImportError:
+    PLOTTING_ENABLED = False
 
 
 def _beta_vs_legacy(b, syncpar, plot=False, gen_comp=False):
@@ -20,7 +24,7 @@ def _beta_vs_legacy(b, syncpar, plot=False, gen_comp=False):
 
     phoebe1_rv2[np.isnan(phoebe2_rv2)] = np.nan
 
-    if plot:
+    if PLOTTING_ENABLED and plot:
         print("rv@primary max abs diff: {}".format(max(np.abs(phoebe1_rv1-phoebe2_rv1))))
         print("rv@secondary max abs diff: {}".format(max(np.abs(phoebe1_rv2-phoebe2_rv2))))
         plt.plot(np.abs(phoebe2_rv1-phoebe1_rv1))
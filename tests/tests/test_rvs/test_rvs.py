@@ -54,12 +54,15 @@ def test_binary(plot=False, gen_comp=False):
     system2 = [215., 257.5]
     system3 = [8600., 65000.]
 
+    # loading the default binary is much more expensive than copying it
+    b_default = phoebe.Bundle.default_binary()
+
     ind = 0
     for q in [0.5, 1.]:
         for system in [system1, system2, system3]:
             ind += 1
 
-            b = phoebe.Bundle.default_binary()
+            b = b_default.copy()
 
             b.set_value('sma@binary', system[0])
             b.set_value('period@binary', system[1])